@@ -3,41 +3,153 @@
     Author: Chi-Kit Pao
 """
 
+import collections
+import concurrent.futures
 import os
+import re
+import sys
 import time
 
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from common import loader
+
 
 def parse1(line):
     digits = list(filter(lambda c: c.isdigit(), list(line)))
     return (ord(digits[0]) - ord("0")) * 10 + ord(digits[-1]) - ord("0")
 
 
+DIGIT_WORDS = ["one", "two", "three", "four", "five", "six", "seven", "eight", "nine"]
+DIGIT_VALUES = {str(digit): digit for digit in range(10)}
+DIGIT_VALUES.update({word: digit for digit, word in enumerate(DIGIT_WORDS, 1)})
+DIGIT_PATTERN = "|".join([r"\d"] + DIGIT_WORDS)
+# Words may overlap (e.g. "eightwo"), so the last digit is searched from the
+# right, i.e. in the reversed line with reversed words.
+FIRST_DIGIT = re.compile(DIGIT_PATTERN)
+LAST_DIGIT = re.compile("|".join([r"\d"] + [word[::-1] for word in DIGIT_WORDS]))
+
+
 def parse2(line):
-    digits = [(i, ord(c) - ord("0")) for i, c in enumerate(list(line)) if c.isdigit()]
-    digit_words = ["one", "two", "three", "four", "five", "six", "seven", "eight", "nine"]
-    for digit, word in enumerate(digit_words, 1):
-        digits.extend([(i, digit) for i in range(len(line)) if line[i: i + len(word)] == word])
-    digits.sort()
-    return digits[0][1] * 10 + digits[-1][1]
+    first = FIRST_DIGIT.search(line).group()
+    last = LAST_DIGIT.search(line[::-1]).group()[::-1]
+    return DIGIT_VALUES[first] * 10 + DIGIT_VALUES[last]
+
+
+# Batch mode: the patterns run over the whole input buffer at once. Within a
+# line the lazy ".*?" finds the first digit, the greedy ".*" the last one.
+BATCH_VALUES = {key.encode(): value for key, value in DIGIT_VALUES.items()}
+BATCH_PATTERNS = {
+    1: (re.compile(rb"^.*?(\d)", re.MULTILINE), re.compile(rb"^.*(\d)", re.MULTILINE)),
+    2: (
+        re.compile(rb"^.*?(%s)" % DIGIT_PATTERN.encode(), re.MULTILINE),
+        re.compile(rb"^.*(%s)" % DIGIT_PATTERN.encode(), re.MULTILINE),
+    ),
+}
+
+
+def batch_sum(buffer, part):
+    """ Sum of the calibration values of a whole bytes-like buffer (e.g. a
+        memory-mapped file) without splitting it into lines.
+    """
+    first_pattern, last_pattern = BATCH_PATTERNS[part]
+    firsts = sum([BATCH_VALUES[d] for d in first_pattern.findall(buffer)])
+    lasts = sum([BATCH_VALUES[d] for d in last_pattern.findall(buffer)])
+    return firsts * 10 + lasts
+
+
+def chunk_sums(chunk):
+    return batch_sum(chunk, 1), batch_sum(chunk, 2), len(re.findall(rb"^.", chunk, re.MULTILINE))
+
+
+def stream_sums(lines, workers=0, chunk_size=1 << 20):
+    """ Sums of both parts and line count, the input is read in chunks of
+        chunk_size bytes, so the memory usage doesn't depend on its size.
+        With workers > 0 the chunks are processed by worker processes.
+    """
+    totals = [0, 0, 0]
+    chunks = loader.iter_chunks(lines, chunk_size)
+    if workers <= 0:
+        for sums in map(chunk_sums, chunks):
+            totals = [t + s for t, s in zip(totals, sums)]
+        return totals
+
+    with concurrent.futures.ProcessPoolExecutor(workers) as executor:
+        # At most two chunks per worker are read ahead.
+        pending = collections.deque()
+        for chunk in chunks:
+            if len(pending) >= 2 * workers:
+                totals = [t + s for t, s in zip(totals, pending.popleft().result())]
+            pending.append(executor.submit(chunk_sums, chunk))
+        for future in pending:
+            totals = [t + s for t, s in zip(totals, future.result())]
+    return totals
+
+
+def parse_input(lines):
+    return loader.read_lines(lines)
+
+
+def part1(lines):
+    return sum(map(parse1, lines))
+
+
+def part2(lines):
+    return sum(map(parse2, lines))
+
+
+# Streaming with a worker process per CPU, a variant for benchmark.py
+def parse_input_stream_workers(lines):
+    # Both sums in one pass over the input
+    return stream_sums(lines, os.cpu_count())[:2]
+
+
+def part1_stream_workers(sums):
+    return sums[0]
+
+
+def part2_stream_workers(sums):
+    return sums[1]
 
 
 def main():
     start_time = time.time()
 
-    file_path = os.path.dirname(__file__)
-    with open(os.path.join(file_path, "input.txt"), "r") as f:
-        lines = list(map(lambda s: s.replace("\n", ""), f.readlines()))
-        result1 = 0
-        result2 = 0
-        for line in lines:
-            result1 += parse1(line)
-            result2 += parse2(line)
+    # With --batch, the input is decoded as one buffer. With --stream, it is
+    # decoded in chunks of constant size, optionally by worker processes
+    # (--workers=N).
+    args = loader.parse_args(
+        {"batch": "decode the input as one buffer", "stream": "decode the input in chunks"}, workers=True
+    )
+    batch = args.batch
+    # Worker processes only decode chunks, --workers implies --stream.
+    stream = args.stream or args.workers > 0
+    workers = args.workers
+    if batch and stream:
+        sys.exit("Day01.py: error: --batch can't be combined with --stream or --workers")
+
+    # Streaming reads the file instead of mapping it into memory.
+    with loader.open_input(__file__, args.argv, mapped=not stream) as f:
+        if batch:
+            buffer = loader.read_buffer(f)
+            result1 = batch_sum(buffer, 1)
+            result2 = batch_sum(buffer, 2)
+            line_count = len(re.findall(rb"^.", buffer, re.MULTILINE))
+        elif stream:
+            result1, result2, line_count = stream_sums(f, workers)
+        else:
+            lines = parse_input(f)
+    if not batch and not stream:
+        result1 = part1(lines)
+        result2 = part2(lines)
 
     print("Question 1: What is the sum of all of the calibration values?")
     print(f"Answer: {result1}")
     print("Question 2: What is the sum of all of the calibration values?")
     print(f"Answer: {result2}")
-    print(f"Time elapsed: {time.time() - start_time} s")
+    elapsed = time.time() - start_time
+    print(f"Time elapsed: {elapsed} s")
+    if batch or stream:
+        print(f"Lines per second: {line_count / elapsed:.0f}")
 
 
 if __name__ == "__main__":
@@ -1,13 +1,24 @@
 """ Advent of Code 2023, Day 2
     Day 2: Cube Conundrum
     Author: Chi-Kit Pao
+    REMARK: Requires numpy to run this program.
 """
 
 import math
+import numpy as np
 import os
 import re
+import sys
 import time
 
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from common import loader
+
+
+# Counts of red, green and blue cubes in the bag (part 1)
+LIMITS = np.array([12, 13, 14])
+COLOR_INDEX = {ord("r"): 0, ord("g"): 1, ord("b"): 2}
+
 
 def check1(values):
     return all(map(lambda v: v[0] <= 12 and v[1] <= 13 and v[2] <= 14, values))
@@ -58,23 +69,80 @@ def parse(line):
     return int(nr), p2_list
 
 
+def parse_input(lines):
+    """ Tokenizes all games at once. Returns the game IDs, the draws as array
+        of shape (draws, 3) with the counts of red, green and blue cubes, and
+        the index of the first draw of every game.
+    """
+    ids = []
+    offsets = []
+    draws = []
+    draw = None
+    # Example input
+    # Game 1: 3 blue, 4 red; 1 red, 2 green, 6 blue; 2 green
+    tokens = iter(bytes(loader.read_buffer(lines)).split())
+    for token in tokens:
+        if token == b"Game":
+            ids.append(int(next(tokens)[:-1]))
+            offsets.append(len(draws))
+            draw = [0, 0, 0]
+            draws.append(draw)
+        else:
+            color = next(tokens)
+            draw[COLOR_INDEX[color[0]]] = int(token)
+            if color.endswith(b";"):
+                draw = [0, 0, 0]
+                draws.append(draw)
+    return np.array(ids), np.array(draws).reshape(-1, 3), np.array(offsets)
+
+
+def game_maxima(draws, offsets):
+    # Fewest cubes of every color per game
+    return np.maximum.reduceat(draws, offsets, axis=0)
+
+
+def part1(games):
+    ids, draws, offsets = games
+    possible = np.all(game_maxima(draws, offsets) <= LIMITS, axis=1)
+    return int(ids[possible].sum())
+
+
+def part2(games):
+    _, draws, offsets = games
+    return int(np.prod(game_maxima(draws, offsets), axis=1).sum())
+
+
+# Previous line by line implementation, for comparison in benchmark.py
+def parse_input_per_line(lines):
+    values = dict()
+    for line in loader.iter_lines(lines):
+        nr, p2 = parse(line)
+        values[nr] = p2
+    return values
+
+
+def part1_per_line(values):
+    result = 0
+    for k, v in values.items():
+        if check1(v):
+            result += k
+    return result
+
+
+def part2_per_line(values):
+    result = 0
+    for v in values.values():
+        result += power(v)
+    return result
+
+
 def main():
     start_time = time.time()
 
-    file_path = os.path.dirname(__file__)
-    with open(os.path.join(file_path, "input.txt"), "r") as f:
-        lines = list(map(lambda s: s.replace("\n", ""), f.readlines()))
-        values = dict()
-        for line in lines:
-            nr, p2 = parse(line)
-            values[nr] = p2
-        result1 = 0
-        for k, v in values.items():
-            if check1(v):
-                result1 += k
-        result2 = 0
-        for k, v in values.items():
-            result2 += power(v)
+    with loader.open_input(__file__) as f:
+        games = parse_input(f)
+    result1 = part1(games)
+    result2 = part2(games)
 
     print("Question 1: What is the sum of the IDs of those games?")
     print(f"Answer: {result1}")
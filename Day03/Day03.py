@@ -1,120 +1,141 @@
 """ Advent of Code 2023, Day 3
     Day 3: Gear Ratios
     Author: Chi-Kit Pao
+    REMARK: Requires numpy to run this program.
 """
 
-from collections import defaultdict
+import concurrent.futures
+import numpy as np
 import os
+import re
+import sys
 import time
 
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from common import loader
+
+NUMBER = re.compile(r"\d+")
+# All 8 neighbors and the position itself
+OFFSETS = [(dr, dc) for dr in (-1, 0, 1) for dc in (-1, 0, 1)]
+
+
+def parse_input(lines):
+    """ Returns the values and rows of all numbers (in reading order) and
+        grids of the schematic size: the index of the number at every digit
+        (-1 elsewhere), a mask of the symbols and a mask of the gear symbols.
+    """
+    lines = loader.read_lines(lines)
+    # The grid is made of the concatenated lines.
+    assert all(map(lambda l: len(l) == len(lines[0]), lines)), "Lines of different length!"
+    grid = np.frombuffer("".join(lines).encode(), dtype=np.uint8).reshape(len(lines), -1)
+    values = np.array([int(m.group()) for line in lines for m in NUMBER.finditer(line)], dtype=np.int64)
+
+    digits = (grid >= ord("0")) & (grid <= ord("9"))
+    # First digits of the numbers, numbered in reading order like the values
+    starts = digits.copy()
+    starts[:, 1:] &= ~digits[:, :-1]
+    number_ids = np.cumsum(starts.ravel(), dtype=np.int32).reshape(grid.shape) - 1
+    number_ids[~digits] = -1
+    symbols = ~digits & (grid != ord("."))
+    return values, np.nonzero(starts)[0], number_ids, symbols, grid == ord("*")
+
+
+def neighborhood(grid, rows, cols, fill):
+    # Values of grid around the positions (rows, cols), shape (positions, 9)
+    padded = np.pad(grid, 1, constant_values=fill)
+    return np.stack([padded[rows + 1 + dr, cols + 1 + dc] for dr, dc in OFFSETS], axis=1)
+
+
+def part_number_sum(schematic, first_row=0, end_row=None):
+    # Only numbers in the rows [first_row, end_row) are summed up.
+    values, number_rows, number_ids, symbols, _ = schematic
+    rows, cols = np.nonzero(symbols)
+    # Numbers with a digit next to a symbol
+    ids = np.unique(neighborhood(number_ids, rows, cols, -1))
+    ids = ids[ids >= 0]
+    end_row = len(number_ids) if end_row is None else end_row
+    ids = ids[(number_rows[ids] >= first_row) & (number_rows[ids] < end_row)]
+    return int(values[ids].sum())
+
+
+def gear_ratio_sum(schematic, first_row=0, end_row=None):
+    # Only gears in the rows [first_row, end_row) are summed up.
+    values, _, number_ids, _, gears = schematic
+    rows, cols = np.nonzero(gears[first_row:end_row])
+    rows += first_row
+    neighbors = np.sort(neighborhood(number_ids, rows, cols, -1), axis=1)
+    # Count the different numbers next to every gear
+    new_number = (neighbors >= 0) & np.concatenate(
+        [np.full((len(neighbors), 1), True), neighbors[:, 1:] != neighbors[:, :-1]], axis=1
+    )
+    pairs = neighbors[new_number.sum(axis=1) == 2]
+    smallest = np.where(pairs >= 0, pairs, len(values)).min(axis=1)
+    return int((values[smallest] * values[pairs[:, -1]]).sum())
+
+
+def part1(schematic):
+    return part_number_sum(schematic)
+
+
+def part2(schematic):
+    return gear_ratio_sum(schematic)
+
+
+def band_sums(band):
+    lines, first_row, end_row, parts = band
+    schematic = parse_input(lines)
+    functions = {1: part_number_sum, 2: gear_ratio_sum}
+    return [functions[part](schematic, first_row, end_row) for part in parts]
+
+
+def solve_bands(lines, workers, band_count=None, parts=(1, 2)):
+    """ Solves the given parts in horizontal bands of rows on a process pool,
+        returns the answers in the order of parts. Every band is extended by
+        the row above and below (halo), so that numbers and gears of the band
+        see all their neighbors. Numbers and gears in the halo belong to the
+        adjacent band and are not counted.
+    """
+    lines = loader.read_lines(lines)
+    band_count = 4 * workers if band_count is None else band_count
+    band_rows = max(1, -(-len(lines) // band_count))
+    bands = []
+    for start in range(0, len(lines), band_rows):
+        end = min(len(lines), start + band_rows)
+        halo_start = max(0, start - 1)
+        bands.append((lines[halo_start:end + 1], start - halo_start, end - halo_start, parts))
+    with concurrent.futures.ProcessPoolExecutor(workers) as executor:
+        sums = list(executor.map(band_sums, bands))
+    return tuple([sum([s[i] for s in sums]) for i in range(len(parts))])
+
+
+# Bands on a worker process per CPU, a variant for benchmark.py
+def parse_input_bands(lines):
+    return loader.read_lines(lines)
+
+
+def part1_bands(lines):
+    return solve_bands(lines, os.cpu_count(), parts=(1,))[0]
+
 
-def get_surroundings(n, line_count, column_count):
-    result = []
-
-    check_left = False
-    check_right = False
-    check_up = False
-    check_down = False
-    if n[0] - 1 >= 0:
-        check_up = True
-    if n[0] + 1 < line_count:
-        check_down = True
-    if n[1] - 1 >= 0:
-        check_left = True
-    if n[1] + n[2] < column_count:
-        check_right = True
-
-    if check_up:
-        if check_left:
-            result.append((n[0] - 1, n[1] - 1))
-        for i in range(n[2]):
-            result.append((n[0] - 1, n[1] + i))
-        if check_right:
-            result.append((n[0] - 1, n[1] + n[2]))
-    if check_left:
-        result.append((n[0], n[1] - 1))
-    if check_right:
-        result.append((n[0], n[1] + n[2]))
-    if check_down:
-        if check_left:
-            result.append((n[0] + 1, n[1] - 1))
-        for i in range(n[2]):
-            result.append((n[0] + 1, n[1] + i))
-        if check_right:
-            result.append((n[0] + 1, n[1] + n[2]))
-
-    return result
-
-
-def parse_numbers(line_number, line):
-    result = []
-    new_string = "".join(list(map(lambda c: c if c.isdigit() else " ", line)))
-    for i in range(len(new_string) - 1):
-        start_index = None
-        if i == 0:
-            if new_string[i].isdigit():
-                start_index = 0
-            elif not new_string[i].isdigit() and new_string[i + 1].isdigit():
-                start_index = i + 1
-        elif not new_string[i].isdigit() and new_string[i + 1].isdigit():
-            start_index = i + 1
-        if start_index is not None:
-            try:
-                index_ws = new_string[start_index:].index(" ")
-                number = int(new_string[start_index : start_index + index_ws])
-                result.append((line_number, start_index, index_ws, number))
-            except ValueError:
-                number = int(new_string[start_index:])
-                result.append(
-                    (line_number, start_index, len(new_string) - start_index, number)
-                )
-    return result
-
-
-def parse_symbols(line_number, line):
-    result = []
-    for i, c in enumerate(list(line)):
-        if c != "." and not c.isdigit():
-            result.append((line_number, i, c))
-    return result
+def part2_bands(lines):
+    return solve_bands(lines, os.cpu_count(), parts=(2,))[0]
 
 
 def main():
     start_time = time.time()
 
-    numbers = []
-    symbols = dict()
-    gears = defaultdict(set)
-
-    file_path = os.path.dirname(__file__)
-    with open(os.path.join(file_path, "input.txt"), "r") as f:
-        lines = list(map(lambda s: s.replace("\n", ""), f.readlines()))
-        for line_number, line in enumerate(lines):
-            line_numbers = parse_numbers(line_number, line)
-            numbers.extend(line_numbers)
-            line_symbols = parse_symbols(line_number, line)
-            for s in line_symbols:
-                symbols[(s[0], s[1])] = s[2]
-
-    result1 = 0
-    for n in numbers:
-        found_symbol = False
-        surroundings = get_surroundings(n, len(lines), len(lines[0]))
-        for s in surroundings:
-            if s in symbols.keys():
-                found_symbol = True
-                symbol = symbols[s]
-                if symbol == "*":
-                    gears[s].add(n)
-
-        if found_symbol:
-            result1 += n[3]
-
-    result2 = 0
-    for v in gears.values():
-        if len(v) == 2:
-            l = list(v)
-            result2 += l[0][3] * l[1][3]
+    # With --workers=N, the schematic is solved in bands by N processes.
+    args = loader.parse_args(workers=True)
+    workers = args.workers
+
+    with loader.open_input(__file__, args.argv) as f:
+        if workers > 0:
+            result1, result2 = solve_bands(f, workers)
+        else:
+            schematic = parse_input(f)
+    if workers == 0:
+        result1 = part1(schematic)
+        result2 = part2(schematic)
 
     print(
         "Question 1: What is the sum of all of the part numbers in the engine schematic?"
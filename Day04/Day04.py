@@ -1,54 +1,131 @@
 """ Advent of Code 2023, Day 4
     Day 4: Scratchcards
     Author: Chi-Kit Pao
+    REMARK: Requires numpy (2.0 or later) to run this program.
 """
 
+import collections
+import numpy as np
 import os
-import re
+import sys
 import time
 
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from common import loader
 
-def parse(line):
-    p1, rest1 = line.split(": ")
-    match = re.match(r"Card\s+(?P<card>\d+)", p1)
-    groupdict = match.groupdict()
-    card = int(groupdict["card"])
 
-    p2, p3 = rest1.split(" | ")
-    winning = []
-    matches = re.findall(r"\s*(\d+)", p2)
-    for match in matches:
-        winning.append(int(match))
-    own = []
-    matches = re.findall(r"\s*(\d+)", p3)
-    for match in matches:
-        own.append(int(match))
+def bitmasks(numbers):
+    # Sets of numbers below 128 as two uint64 words per row
+    assert numbers.size == 0 or (numbers.min() >= 0 and numbers.max() < 128), "Numbers not between 0 and 127!"
+    words = []
+    for low in (0, 64):
+        in_word = (numbers >= low) & (numbers < low + 64)
+        bits = np.where(in_word, np.left_shift(np.uint64(1), (numbers - low).clip(0, 63).astype(np.uint64)), np.uint64(0))
+        words.append(np.bitwise_or.reduce(bits, axis=1))
+    return np.stack(words, axis=1)
 
-    return card, winning, own
+
+def parse_input(lines):
+    """ Returns the number of matches of every card. """
+    # Example input
+    # Card   1: 77 45  9 81 96  5 91  3 66 76 |  7 56 66 49 96 58 54 34 37  5 14 85 45 91  9 22 81 50 88 77 76  3 83 93 18
+    # All cards have the same number of winning and own numbers, so that the
+    # tokens form a table.
+    tokens = bytes(loader.read_buffer(lines)).split()
+    if len(tokens) == 0:
+        return np.zeros(0, dtype=np.int64)
+    columns = tokens.index(b"Card", 1) if tokens.count(b"Card") > 1 else len(tokens)
+    table = np.array(tokens).reshape(-1, columns)
+    separator = tokens.index(b"|")
+    winning = bitmasks(table[:, 2:separator].astype(np.int64))
+    own = bitmasks(table[:, separator + 1:].astype(np.int64))
+    return np.bitwise_count(winning & own).sum(axis=1).astype(np.int64)
+
+
+def line_matches(line):
+    # Single card, with Python ints as bitmasks
+    _, numbers = line.split(":")
+    p1, p2 = numbers.split("|")
+    winning = 0
+    own = 0
+    for n in p1.split():
+        winning |= 1 << int(n)
+    for n in p2.split():
+        own |= 1 << int(n)
+    return (winning & own).bit_count()
+
+
+def iter_matches(lines):
+    # Streaming alternative to parse_input: one card after another.
+    for line in loader.iter_lines(lines):
+        yield line_matches(line)
+
+
+def iter_card_counts(matches):
+    """ Yields (matches, copies) of every card in order. The copies won from a
+        card are added to the following cards with a difference array, of
+        which only the next entries (at most the maximum of matches + 1) are
+        kept.
+    """
+    diff = collections.deque()
+    extra = 0
+    for m in matches:
+        if len(diff) > 0:
+            extra += diff.popleft()
+        copies = 1 + extra
+        yield m, copies
+        if m > 0:
+            while len(diff) <= m:
+                diff.append(0)
+            # diff[0] is the next card
+            diff[0] += copies
+            diff[m] -= copies
+
+
+def totals(matches, show_counts=False):
+    # Both answers in one pass, matches can be any iterable (e.g. iter_matches).
+    result1 = 0
+    result2 = 0
+    for card, (m, copies) in enumerate(iter_card_counts(matches), 1):
+        if m > 0:
+            result1 += 1 << (m - 1)
+        result2 += copies
+        if show_counts:
+            print(f"Card {card}: {copies}")
+    return result1, result2
+
+
+def part1(matches):
+    # Points can exceed 64 bits, so they are summed as Python ints for every
+    # number of matches.
+    return sum([count << (m - 1) for m, count in enumerate(np.bincount(matches).tolist()) if m > 0])
+
+
+def part2(matches):
+    return sum([copies for _, copies in iter_card_counts(matches.tolist())])
 
 
 def main():
     start_time = time.time()
 
-    file_path = os.path.dirname(__file__)
-    with open(os.path.join(file_path, "input.txt"), "r") as f:
-        lines = list(map(lambda s: s.replace("\n", ""), f.readlines()))
+    # --stream reads one card after another (constant memory), --counts prints
+    # the number of copies of every card.
+    args = loader.parse_args(
+        {"stream": "read one card after another", "counts": "print the number of copies of every card"}
+    )
+    stream = args.stream
+    show_counts = args.counts
 
-    points = [0]
-    result1 = 0
-    for line in lines:
-        _, winning, own = parse(line)
-        inters = set(winning).intersection(own)
-        l = len(inters)
-        points.append(l)
-        if l > 0:
-            result1 += 2 ** (l - 1)
-
-    card_count = [0] + [1] * (len(points) - 1)
-    for i in range(1, len(points)):
-        for j in range(i + 1, i + points[i] + 1):
-            card_count[j] += card_count[i]
-    result2 = sum(card_count)
+    with loader.open_input(__file__, args.argv, mapped=not stream) as f:
+        if stream:
+            result1, result2 = totals(iter_matches(f), show_counts)
+        else:
+            matches = parse_input(f)
+    if not stream:
+        if show_counts:
+            totals(matches.tolist(), show_counts)
+        result1 = part1(matches)
+        result2 = part2(matches)
 
     print("Question 1: How many points are they worth in total?")
     print(f"Answer: {result1}")
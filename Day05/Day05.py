@@ -1,174 +1,144 @@
 """ Advent of Code 2023, Day 5
     Day 5: If You Give A Seed A Fertilizer
     Author: Chi-Kit Pao
+    REMARK: Requires numpy to run this program.
 """
 
-import itertools
+import bisect
+import numpy as np
 import os
-import re
+import sys
 import time
 
-
-def parse_seeds(lines, start_index):
-    result = []
-    _, p2 = lines[0].split(":")
-    matches = re.findall(r"\s*(\d+)", p2)
-    for match in matches:
-        result.append(int(match))
-    return result, start_index + 2
-
-
-def parse_map(lines, start_index):
-    current_index = start_index + 1
-    line_parsed = 1
-    result = []
-    while current_index < len(lines) and len(lines[current_index]) > 0:
-        match = re.match(
-            r"(?P<dest>\d+) (?P<src>\d+) (?P<length>\d+)", lines[current_index]
-        )
-        groupdict = match.groupdict()
-        dest = int(groupdict["dest"])
-        src = int(groupdict["src"])
-        length = int(groupdict["length"])
-        result.append((src, dest, length, src + length))
-        current_index += 1
-        line_parsed += 1
-    result.sort()
-    return result, (line_parsed + 1)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from common import instrument, loader
 
 
 class Map:
-    def __init__(self, conversions):
-        self.conversions = conversions
-
-    def calc(self, n):
-        for c in self.conversions:
-            if c[0] <= n < c[0] + c[2]:
-                return c[1] + n - c[0]
-        return n
-
-    def calc_ranges(self, ranges):
-        result = []
-        for r in ranges:
-            result.extend(self.__calc_range(r))
+    def __init__(self, name, conversions):
+        # conversions: (src, dest, length) in any order, sorted once and the
+        # gaps (including the one at 0) filled with identity conversions in
+        # the same pass.
+        self.name = name
+        rows = []
+        end = 0
+        for src, dest, length in sorted(conversions):
+            if src > end:
+                rows.append((end, end, src - end))
+            rows.append((src, dest, length))
+            end = src + length
+        # Array-backed columns
+        self.src, self.dest, self.length = np.array(rows, dtype=np.int64).reshape(-1, 3).T
+
+    def to_function(self):
+        # Numbers after the last conversion stay the same.
+        starts = np.append(self.src, self.src[-1] + self.length[-1] if len(self.src) > 0 else 0)
+        offsets = np.append(self.dest - self.src, 0)
+        return PiecewiseOffset(starts.tolist(), offsets.tolist())
+
+
+class PiecewiseOffset:
+    """ The function n -> n + offsets[i] for starts[i] <= n < starts[i + 1],
+        the last piece is unbounded.
+    """
+
+    def __init__(self, starts, offsets):
+        self.starts = starts
+        self.offsets = offsets
+        self.start_array = np.array(starts, dtype=np.int64)
+        self.offset_array = np.array(offsets, dtype=np.int64)
+
+    def __call__(self, n):
+        return n + self.offsets[bisect.bisect_right(self.starts, n) - 1]
+
+    def batch(self, values):
+        # Vectorized __call__ for an int64 array
+        return values + self.offset_array[np.searchsorted(self.start_array, values, side="right") - 1]
+
+    def then(self, other):
+        # Composition other(self(n)): the image of every piece is split at the
+        # starts of the pieces of other.
+        starts = []
+        offsets = []
+        for i, (start, offset) in enumerate(zip(self.starts, self.offsets)):
+            end = self.starts[i + 1] if i + 1 < len(self.starts) else None
+            j = bisect.bisect_right(other.starts, start + offset) - 1
+            while j < len(other.starts) and (end is None or other.starts[j] < end + offset):
+                new_start = max(start, other.starts[j] - offset)
+                new_offset = offset + other.offsets[j]
+                # Merge neighboring pieces with the same offset
+                if len(offsets) == 0 or offsets[-1] != new_offset:
+                    starts.append(new_start)
+                    offsets.append(new_offset)
+                j += 1
+        return PiecewiseOffset(starts, offsets)
+
+    def minimum(self, ranges):
+        # Minimum value for n in any of the ranges [start, end). The ranges are
+        # swept in order, every one starts at its first piece.
+        result = None
+        for start, end in sorted(ranges):
+            i = bisect.bisect_right(self.starts, start) - 1
+            while i < len(self.starts) and self.starts[i] < end:
+                value = max(start, self.starts[i]) + self.offsets[i]
+                if result is None or value < result:
+                    result = value
+                i += 1
         return result
 
-    def __calc_range(self, r):
-        start, end_excl = r[0], r[1]
-        current_conversions = list(
-            itertools.takewhile(
-                lambda c2: c2[0] < end_excl,
-                itertools.dropwhile(
-                    lambda c1: c1[0] + c1[2] <= start, self.conversions
-                ),
-            )
-        )
-        current_conversion_count = len(current_conversions)
-        assert current_conversion_count > 0
-        result = []
-        if current_conversion_count == 1:
-            offset = current_conversions[0][1] - current_conversions[0][0]
-            result.append((r[0] + offset, r[1] + offset))
-        else:
-            first_offset = current_conversions[0][1] - current_conversions[0][0]
-            result.append(
-                (r[0] + first_offset, current_conversions[0][3] + first_offset)
-            )
-
-            if current_conversion_count > 2:
-                for i in range(1, current_conversion_count - 1):
-                    offset = current_conversions[i][1] - current_conversions[i][0]
-                    result.append(
-                        (
-                            current_conversions[i][0] + offset,
-                            current_conversions[i][3] + offset,
-                        )
-                    )
-
-            last_offset = current_conversions[-1][1] - current_conversions[-1][0]
-            result.append(
-                (current_conversions[-1][0] + last_offset, r[1] + last_offset)
-            )
-        return result
 
+def compose(maps):
+    function = PiecewiseOffset([0], [0])
+    for m in maps:
+        function = function.then(m.to_function())
+    return function
 
-def part1(seeds, maps):
-    locations = []
-    for s in seeds:
-        value = s
-        for m in maps:
-            value = m.calc(value)
-        locations.append(value)
-    locations.sort()
-    return locations[0]
+
+def part1(almanac):
+    seeds, _, seed_to_location = almanac
+    return int(seed_to_location.batch(np.array(seeds, dtype=np.int64)).min())
+
+
+def part2(almanac):
+    seeds, _, seed_to_location = almanac
+    return seed_to_location.minimum([(seeds[i], seeds[i] + seeds[i + 1]) for i in range(0, len(seeds), 2)])
 
 
-def part2(seeds, maps):
-    min_value = None
-    for i in range(0, len(seeds), 2):
-        values = [(seeds[i], seeds[i] + seeds[i + 1])]  # [start, end)
+def parse_input(lines):
+    # Sections in any number: "seeds: ..." and "X-to-Y map:" followed by
+    # lines "dest src length".
+    seeds = []
+    sections = []
+    for line in loader.iter_lines(lines):
+        if line.startswith("seeds:"):
+            seeds = [int(s) for s in line[len("seeds:"):].split()]
+        elif line.endswith(" map:"):
+            sections.append((line[:-len(" map:")], []))
+        elif len(line) > 0:
+            dest, src, length = map(int, line.split())
+            sections[-1][1].append((src, dest, length))
+    maps = [Map(name, conversions) for name, conversions in sections]
+    if instrument.enabled:
         for m in maps:
-            new_values = m.calc_ranges(values)
-            values = new_values
-        assert len(values) > 0
-        values.sort()
-        if min_value is None:
-            min_value = values[0]
-        elif values[0] < min_value:
-            min_value = values[0]
-    return min_value[0]
+            instrument.debug(m.name, len(m.src), m.src[0], m.src[-1] + m.length[-1])
+    # The maps are composed once for both parts.
+    return seeds, maps, compose(maps)
 
 
 def main():
     start_time = time.time()
 
-    file_path = os.path.dirname(__file__)
-    maps = []
-    with open(os.path.join(file_path, "input.txt"), "r") as f:
-        lines = list(map(lambda s: s.replace("\n", ""), f.readlines()))
-        start_line = 0
-
-        seeds, lines_read = parse_seeds(lines, start_line)
-        start_line += lines_read
-
-        end_exclusive = 0
-        for i in range(7):
-            m, lines_read = parse_map(lines, start_line)
-            print(i, m[0][0], m[-1][-1])
-            assert m[0][0] == 0
-            end_exclusive = max(end_exclusive, m[-1][-1])
-            # Fill gaps in between for easier handling
-            gaps = []
-            for j in range(len(m) - 1):
-                if m[j][-1] != m[j + 1][0]:
-                    gaps.append(
-                        (m[j][-1], m[j][-1], m[j + 1][0] - m[j][-1], m[j + 1][0])
-                    )
-            if len(gaps) > 0:
-                m.extend(gaps)
-                m.sort()
-            maps.append(Map(m))
-            start_line += lines_read
-        # Fill gaps at the end
-        for mo in maps:
-            m = mo.conversions
-            if m[-1][-1] < end_exclusive:
-                m.append(
-                    (m[-1][-1], m[-1][-1], end_exclusive - m[-1][-1], end_exclusive)
-                )
-
-        for i in range(0, len(seeds), 2):
-            print("seed", (seeds[i], seeds[i] + seeds[i + 1]))
-            assert seeds[i] + seeds[i + 1] < end_exclusive
+    with loader.open_input(__file__) as f:
+        almanac = parse_input(f)
 
     print(
         "Question 1: What is the lowest location number that corresponds to any of the initial seed numbers?"
     )
-    print(f"Answer: {part1(seeds, maps)}")
+    print(f"Answer: {part1(almanac)}")
     print(
         "Question 2: What is the lowest location number that corresponds to any of the initial seed numbers?"
     )
-    print(f"Answer: {part2(seeds, maps)}")
+    print(f"Answer: {part2(almanac)}")
     print(f"Time elapsed: {time.time() - start_time} s")
 
 
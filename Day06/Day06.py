@@ -1,39 +1,120 @@
 """ Advent of Code 2023, Day 6
     Day 6: Wait For It
     Author: Chi-Kit Pao
+    REMARK: Requires numpy to run this program.
 """
 
 import math
+import numpy as np
+import os
+import sys
 import time
 
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from common import loader
+
 
 def winning_count(time_, distance):
-    count = [0] * (time_ + 1)
-    for i in range(0, time_ + 1):
-        count[i] = (time_ - i) * i
+    # Number of integers i in [0, time_] with (time_ - i) * i > distance.
+    # They lie strictly between the roots of i^2 - time_ * i + distance, which
+    # are (time_ -/+ sqrt(time_^2 - 4 * distance)) / 2.
+    discriminant = time_ * time_ - 4 * distance
+    if discriminant < 0:
+        return 0
+    root = math.isqrt(discriminant)
+    # low is the smallest winning number or the one before it.
+    low = max((time_ - root) // 2, 0)
+    if (time_ - low) * low <= distance:
+        low += 1
+    # Winning numbers are symmetric around time_ / 2.
+    return max(time_ - 2 * low + 1, 0)
+
+
+def winning_counts(times, distances):
+    """ Number of ways to win for every race, times and distances are arrays. """
+    # Vectorized if the squares fit into int64 and the square roots can be
+    # corrected by one step, exact with Python integers otherwise.
+    if times.dtype == object or len(times) == 0 or times.max() >= 2**31 or distances.max() >= 2**60:
+        return np.array([winning_count(t, d) for t, d in zip(times.tolist(), distances.tolist())], dtype=object)
+    discriminant = times * times - 4 * distances
+    root = np.sqrt(np.maximum(discriminant, 0).astype(np.float64)).astype(np.int64)
+    root -= root * root > discriminant
+    root += (root + 1) * (root + 1) <= discriminant
+    low = np.maximum((times - root) // 2, 0)
+    low += (times - low) * low <= distances
+    return np.where(discriminant < 0, 0, np.maximum(times - 2 * low + 1, 0))
+
+
+def product(values):
+    # Pairwise, a running product of millions of numbers takes quadratic time.
+    values = list(values)
+    if len(values) == 0:
+        return 1
+    while len(values) > 1:
+        values = [math.prod(values[i:i + 2]) for i in range(0, len(values), 2)]
+    return values[0]
+
+
+def digits_to_int(digits):
+    # int() of a long string takes quadratic time (and is limited to 4300
+    # digits by default).
+    if len(digits) <= 1000:
+        return int(digits)
+    half = len(digits) // 2
+    return digits_to_int(digits[:half]) * 10 ** (len(digits) - half) + digits_to_int(digits[half:])
+
+
+def to_array(tokens):
+    values = list(map(int, tokens))
+    try:
+        return np.array(values, dtype=np.int64)
+    except OverflowError:
+        return np.array(values, dtype=object)
+
+
+def parse_input(lines):
+    # Example input
+    # Time:      7  15   30
+    # Distance:  9  40  200
+    rows = dict()
+    for line in loader.iter_lines(lines):
+        if ":" in line:
+            name, values = line.split(":")
+            rows[name.strip()] = values.split()
+    # Part 2 reads every line as one number ("bad kerning"), only the digits
+    # are kept here.
+    races = (to_array(rows["Time"]), to_array(rows["Distance"]))
+    race2 = ("".join(rows["Time"]), "".join(rows["Distance"]))
+    return races, race2
+
 
-    return sum(map(lambda x: x > distance, count))
+def part1(data):
+    races, _ = data
+    counts = winning_counts(*races)
+    if (counts == 0).any():
+        return 0
+    return product(counts.tolist())
 
 
-def part1(races):
-    return math.prod([winning_count(t, d) for t, d in races])
+def part2(data):
+    _, race2 = data
+    return winning_count(digits_to_int(race2[0]), digits_to_int(race2[1]))
 
 
 def main():
     start_time = time.time()
 
-    #  Time-Distance pairs
-    races = [(46, 208), (85, 1412), (75, 1257), (82, 1410)]
-    race2 = (46857582, 208141212571410)
+    with loader.open_input(__file__) as f:
+        data = parse_input(f)
 
     print(
         "Question 1: Determine the number of ways you could beat the record "
         "in each race. What do you get if you multiply these numbers "
         "together?"
     )
-    print(f"Answer: {part1(races)}")
+    print(f"Answer: {part1(data)}")
     print("How many ways can you beat the record in this one much longer race?")
-    print(f"Answer: {winning_count(race2[0], race2[1])}")
+    print(f"Answer: {part2(data)}")
     print(f"Time elapsed: {time.time() - start_time} s")
 
 
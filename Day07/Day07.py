@@ -1,28 +1,30 @@
 """ Advent of Code 2023, Day 7
     Day 7: Camel Cards
     Author: Chi-Kit Pao
+    REMARK: Requires numpy to run this program.
 """
 
-from collections import defaultdict
-import copy
+import numpy as np
+import operator
 import os
+import sys
 import time
 
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from common import loader
 
-def get_card_value(card, part):
-    if part == 1:
-        value_list = ["2", "3", "4", "5", "6", "7", "8", "9", "T", "J", "Q", "K", "A"]
-    else:
-        value_list = ["J", "2", "3", "4", "5", "6", "7", "8", "9", "T", "Q", "K", "A"]
-    return value_list.index(card[0])
 
+# Card values as hexadecimal digits, so that the five cards of a hand
+# translate into a 20-bit integer.
+CARD_ORDERS = {1: "23456789TJQKA", 2: "J23456789TQKA"}
+TRANSLATIONS = {part: str.maketrans(order, "0123456789ABC") for part, order in CARD_ORDERS.items()}
 
-def get_answer(lines, part):
+
+def get_answer(hand_data, part):
     hands = []
-    for line in lines:
-        cards, bid = line.split()
-        hands.append(Hand(cards, int(bid), part))
-    hands.sort(key=lambda h: h.hash(part))
+    for cards, bid in hand_data:
+        hands.append(Hand(cards, bid, part))
+    hands.sort(key=operator.attrgetter("key"))
     return sum([hand.bid * i for i, hand in enumerate(hands, 1)])
 
 
@@ -40,87 +42,178 @@ class Hand:
     RANK_FOUR_OF_A_KIND = 5
     RANK_FIVE_OF_A_KIND = 6
 
+    # Counts of the different cards, largest first
+    RANK_BY_COUNTS = {
+        (1, 1, 1, 1, 1): RANK_HIGH_CARD,
+        (2, 1, 1, 1): RANK_ONE_PAIR,
+        (2, 2, 1): RANK_TWO_PAIRS,
+        (3, 1, 1): RANK_THREE_OF_A_KIND,
+        (3, 2): RANK_FULL_HOUSE,
+        (4, 1): RANK_FOUR_OF_A_KIND,
+        (5,): RANK_FIVE_OF_A_KIND,
+    }
+
+    __slots__ = ("cards", "bid", "rank", "key")
+
     def __init__(self, cards, bid, part):
-        self.cards = copy.copy(cards)
+        self.cards = cards
         self.bid = bid
-        self.rank = Hand.RANK_HIGH_CARD
-        self.__evaluate_cards(part)
-
-    # def compare(self, other):
-    #     if self.rank != other.rank:
-    #         return self.rank - other.rank
-
-    #     for i in range(len(self.cards)):
-    #         diff = get_card_value(self.cards[0]) - get_card_value(other.cards[0])
-    #         if diff != 0:
-    #             return diff
-    #     raise AssertionError("Both hands are the same!")
-
-    def hash(self, part):
-        result = 0
-        for i in range(5):
-            result += get_card_value(self.cards[4 - i], part) * 100**i
-        result += self.rank * 100**5
-        return result
-
-    def __evaluate_cards(self, part):
+        self.rank = Hand.evaluate_cards(cards, part)
+        # Rank in bits 20 to 22, card values in bits 0 to 19
+        self.key = self.rank << 20 | int(cards.translate(TRANSLATIONS[part]), 16)
+
+    @staticmethod
+    def evaluate_cards(cards, part):
         assert 1 <= part <= 2
-        cards = list(self.cards)
+        joker_count = 0
         if part == 2:
+            # Jokers act like the most frequent other card.
             joker_count = cards.count("J")
-            card_count = defaultdict(int)
-            for c in cards:
-                card_count[c] += 1
-            if joker_count > 0:
-                del card_count["J"]
-            if joker_count == 5:
-                cards = ["A"] * 5
-            elif joker_count == 0:
-                pass
-            else:
-                temp = [(k, v) for k, v in card_count.items()]
-                temp.sort(key=lambda p: p[1] * 100 + get_card_value(p[0], part), reverse=True) 
-                cards = [x if x != "J" else temp[0][0] for x in cards]
-        cards.sort(key=lambda x: get_card_value(x, part), reverse=True)
-        values = list(map(lambda x: get_card_value(x, part), cards))
-        value_differences = []
-        value_diff_bits = 0
-        for i in range(0, 4):
-            value_differences.append(values[i] - values[i + 1])
-            if values[i] != values[i + 1]:
-                value_diff_bits |= 1 << i
-
-        if value_diff_bits == 0:
-            self.rank = Hand.RANK_FIVE_OF_A_KIND
-            return
-        if value_diff_bits == 0xF:
-            self.rank = Hand.RANK_HIGH_CARD
-            return
-        if value_diff_bits == 0x1 or value_diff_bits == 0x8:
-            self.rank = Hand.RANK_FOUR_OF_A_KIND
-            return
-        if value_diff_bits == 0x2 or value_diff_bits == 0x4:
-            self.rank = Hand.RANK_FULL_HOUSE
-            return
-        if value_diff_bits == 0x3 or value_diff_bits == 0x9 or value_diff_bits == 0xC:
-            self.rank = Hand.RANK_THREE_OF_A_KIND
-            return
-        if value_differences.count(0) == 1:
-            self.rank = Hand.RANK_ONE_PAIR
-            return
-
-        self.rank = Hand.RANK_TWO_PAIRS
+            cards = cards.replace("J", "")
+        counts = sorted([cards.count(c) for c in set(cards)], reverse=True)
+        if len(counts) == 0:
+            return Hand.RANK_FIVE_OF_A_KIND
+        counts[0] += joker_count
+        return Hand.RANK_BY_COUNTS[tuple(counts)]
+
+
+def card_value_table(order):
+    """ Value of every card character, indexed by its byte. """
+    table = np.zeros(256, dtype=np.int64)
+    table[np.frombuffer(order.encode(), dtype=np.uint8)] = np.arange(13)
+    return table
+
+
+# Dense sort keys: rank * 13^5 + card values as base-13 number
+CARD_VALUE_TABLES = {part: card_value_table(order) for part, order in CARD_ORDERS.items()}
+PLACE_VALUES = 13 ** np.arange(4, -1, -1)
+# Rank by the sum of the squared counts of the different cards, e.g. 3^2 + 2^2
+# for a full house.
+RANK_BY_SQUARES = np.full(26, -1)
+RANK_BY_SQUARES[[5, 7, 9, 11, 13, 17, 25]] = np.arange(7)
+
+
+def hand_keys(cards):
+    """ Sort keys of both parts, cards is an (n, 5) uint8 array of characters. """
+    same = cards[:, :, None] == cards[:, None, :]
+    # The sum of the counts of the cards at every position is the sum of the
+    # squared counts of the different cards.
+    squares = same.sum(axis=(1, 2))
+    keys1 = RANK_BY_SQUARES[squares] * 13**5 + CARD_VALUE_TABLES[1][cards] @ PLACE_VALUES
+    # Jokers are counted as the most frequent other card.
+    jokers = cards == ord("J")
+    same &= ~jokers[:, :, None] & ~jokers[:, None, :]
+    counts = same.sum(axis=2)
+    largest = counts.max(axis=1)
+    squares = counts.sum(axis=1) - largest**2 + (largest + jokers.sum(axis=1)) ** 2
+    keys2 = RANK_BY_SQUARES[squares] * 13**5 + CARD_VALUE_TABLES[2][cards] @ PLACE_VALUES
+    return keys1, keys2
+
+
+def radix_order(keys):
+    # LSD radix sort of keys below 2^32: NumPy sorts 16-bit integers stably with
+    # a radix sort.
+    order = np.argsort((keys & 0xFFFF).astype(np.uint16), kind="stable")
+    return order[np.argsort((keys[order] >> 16).astype(np.uint16), kind="stable")]
+
+
+def total_winnings(keys, bids):
+    order = radix_order(keys)
+    return int(np.dot(bids[order], np.arange(1, len(keys) + 1)))
+
+
+def stream_winnings(lines, chunk_size=1 << 20):
+    """ Total winnings of both parts, reading the input in chunks. Instead of
+        keeping all hands, only the number of hands and the sum of bids of
+        every key of a chunk are kept. Sorted by key and chunk, the rank of
+        the first hand of such an entry follows from the counts of the
+        entries before it.
+    """
+    # Keys, counts and bid sums of every chunk
+    entries = [([], [], []) for _ in range(2)]
+    # Hands with the same key rank in input order, the extra winnings of the
+    # hands after the first one of a key within a chunk
+    tie_winnings = [0, 0]
+    for chunk in loader.iter_chunks(lines, chunk_size):
+        keys1, keys2, bids = parse_input(chunk)
+        for i, keys in enumerate((keys1, keys2)):
+            order = radix_order(keys)
+            sorted_keys = keys[order]
+            sorted_bids = bids[order]
+            run_starts = np.flatnonzero(np.diff(sorted_keys, prepend=-1))
+            run_lengths = np.diff(np.append(run_starts, len(keys)))
+            earlier = np.arange(len(keys)) - np.repeat(run_starts, run_lengths)
+            tie_winnings[i] += int(np.dot(sorted_bids, earlier))
+            entries[i][0].append(sorted_keys[run_starts])
+            entries[i][1].append(run_lengths)
+            entries[i][2].append(np.add.reduceat(sorted_bids, run_starts))
+    results = []
+    for i in range(2):
+        keys, counts, bid_sums = (np.concatenate(a) if a else np.zeros(0, dtype=np.int64) for a in entries[i])
+        # The radix sort is stable, entries of the same key stay in chunk
+        # order.
+        order = radix_order(keys)
+        counts = counts[order]
+        first_ranks = np.cumsum(counts) - counts + 1
+        results.append(int(np.dot(bid_sums[order], first_ranks)) + tie_winnings[i])
+    return tuple(results)
+
+
+def parse_input(lines):
+    """ Returns the sort keys of both parts and the bids. """
+    tokens = bytes(loader.read_buffer(lines)).split()
+    cards = np.array(tokens[0::2], dtype="S5").view(np.uint8).reshape(-1, 5)
+    bids = np.array(tokens[1::2], dtype=np.bytes_).astype(np.int64)
+    keys1, keys2 = hand_keys(cards)
+    return keys1, keys2, bids
+
+
+def part1(data):
+    keys1, _, bids = data
+    return total_winnings(keys1, bids)
+
+
+def part2(data):
+    _, keys2, bids = data
+    return total_winnings(keys2, bids)
+
+
+def parse_input_per_hand(lines):
+    hand_data = []
+    for line in loader.iter_lines(lines):
+        cards, bid = line.split()
+        hand_data.append((cards, int(bid)))
+    return hand_data
+
+
+def part1_per_hand(hand_data):
+    return get_answer(hand_data, 1)
+
+
+def part2_per_hand(hand_data):
+    return get_answer(hand_data, 2)
 
 
 def main():
     start_time = time.time()
-    with open(os.path.join(os.path.dirname(__file__), "input.txt"), "r") as f:
-        lines = list(map(lambda s: s.replace("\n", ""), f.readlines()))
+
+    # --stream reads the input in chunks and doesn't keep the hands in memory.
+    args = loader.parse_args({"stream": "read the input in chunks"})
+    stream = args.stream
+
+    with loader.open_input(__file__, args.argv, mapped=not stream) as f:
+        if stream:
+            result1, result2 = stream_winnings(f)
+        else:
+            data = parse_input(f)
+    if not stream:
+        result1 = part1(data)
+        result2 = part2(data)
 
     print("Question 1: What are the total winnings?")
-    print(f"Answer: {get_answer(lines, 1)}")
+    print(f"Answer: {result1}")
     print("Question 2: What are the new total winnings?")
-    print(f"Answer: {get_answer(lines, 2)}")
+    print(f"Answer: {result2}")
     print(f"Time elapsed: {time.time() - start_time} s")
 
 
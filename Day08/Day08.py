@@ -1,129 +1,257 @@
 """ Advent of Code 2023, Day 8
     Day 8: Haunted Wasteland
     Author: Chi-Kit Pao
+    REMARK: Requires numpy to run this program.
 """
 
+import concurrent.futures
+from multiprocessing import shared_memory
 import math
+import numpy as np
 import os
 import re
+import sys
 import time
 
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from common import loader
+
+
+def crt(a1, m1, a2, m2):
+    """ Solution (a, m) of x = a1 (mod m1) and x = a2 (mod m2), i.e. x = a
+        (mod m = lcm(m1, m2)), None if there is none. The moduli don't have
+        to be coprime.
+    """
+    g = math.gcd(m1, m2)
+    if (a2 - a1) % g != 0:
+        return None
+    m = m1 // g * m2
+    k = (a2 - a1) // g * pow(m1 // g, -1, m2 // g) % (m2 // g)
+    return (a1 + k * m1) % m, m
+
+
+def earliest_common_step(cycles):
+    """ First step at which all ghosts are on a goal, cycles as returned by
+        ghost_cycle.
+    """
+    # Steps up to the end of the longest tail are checked one by one,
+    # candidates are the goal steps of the first ghost.
+    start = max([tail for tail, _, _ in cycles])
+    tail, period, hits = cycles[0]
+    candidates = set()
+    for step in hits:
+        while step <= start:
+            candidates.add(step)
+            if step <= tail:
+                break
+            step += period
+    common = [step for step in sorted(candidates) if all(map(lambda c: is_goal_step(c, step), cycles))]
+    if len(common) > 0:
+        return common[0]
+
+    # After that, every ghost is on a goal at its goal steps within the cycle
+    # plus multiples of the period.
+    solutions = {(0, 1)}
+    for tail, period, hits in cycles:
+        residues = {step % period for step in hits if step > tail}
+        solutions = {crt(a, m, r, period) for a, m in solutions for r in residues}
+        solutions.discard(None)
+    if len(solutions) == 0:
+        raise AssertionError("The ghosts are never on goals at the same time!")
+    return min([a + ((start - a) // m + 1) * m for a, m in solutions])
+
+
+def is_goal_step(cycle, step):
+    tail, period, hits = cycle
+    if step > tail + period:
+        step = tail + (step - tail - 1) % period + 1
+    return step in hits
+
+
+def find_cycle(pass_end, start):
+    """ Brent's cycle detection on the nodes at the start of every pass over
+        the instructions (the states (node, 0)). Returns the number of passes
+        before the cycle and the cycle length in passes.
+    """
+    power = length = 1
+    tortoise = start
+    hare = pass_end[start]
+    while tortoise != hare:
+        if power == length:
+            tortoise = hare
+            power *= 2
+            length = 0
+        hare = pass_end[hare]
+        length += 1
+
+    tortoise = hare = start
+    for _ in range(length):
+        hare = pass_end[hare]
+    tail = 0
+    while tortoise != hare:
+        tortoise = pass_end[tortoise]
+        hare = pass_end[hare]
+        tail += 1
+    return tail, length
+
+
+def ghost_cycle(graph, go_left, start):
+    """ Returns (tail, period, hits) in steps: after tail steps, the walk
+        from start repeats every period steps, hits are the steps from 1 to
+        tail + period on goals. graph holds the rows left, right, is_goal,
+        pass_end and first_goal of Map as lists or memoryviews.
+    """
+    left, right, is_goal, pass_end, first_goal = graph
+    tail, length = find_cycle(pass_end, start)
+    hits = set()
+    node = start
+    for pass_index in range(tail + length):
+        # Only passes with goals are walked step by step.
+        if first_goal[node] > 0:
+            steps = pass_index * len(go_left)
+            current = node
+            for instruction in go_left:
+                current = left[current] if instruction else right[current]
+                steps += 1
+                if is_goal[current]:
+                    hits.add(steps)
+        node = pass_end[node]
+    return tail * len(go_left), length * len(go_left), hits
+
+
+# Graph of the worker processes, see attach_graph
+worker_graph = None
+
+
+def attach_graph(name, row_length, go_left):
+    global worker_graph
+    memory = shared_memory.SharedMemory(name)
+    # The block may be larger than the table (e.g. rounded up to whole pages).
+    table = memory.buf[:5 * row_length * 8].cast("q")
+    # Slices of the memoryview don't copy the data.
+    worker_graph = (memory, [table[i * row_length:(i + 1) * row_length] for i in range(5)], go_left)
+
+
+def worker_ghost_cycle(start):
+    _, graph, go_left = worker_graph
+    return ghost_cycle(graph, go_left, start)
+
 
 class Map:
     def __init__(self, lines):
+        lines = loader.read_lines(lines)
         self.instructions = lines[0]
-        self.ip = 0
-        self.graph = dict()
+        # Node names are interned to indices into names, left and right.
+        self.names = []
+        targets = []
         for line in lines[2:]:
             match = re.match(r"(?P<node>\w+) = \((?P<left>\w+), (?P<right>\w+)\)", line)
             groupdict = match.groupdict()
-            node = groupdict["node"]
-            left = groupdict["left"]
-            right = groupdict["right"]
-            self.graph[node] = (left, right)
+            self.names.append(groupdict["node"])
+            targets.append((groupdict["left"], groupdict["right"]))
+        self.index = {name: i for i, name in enumerate(self.names)}
+        self.left = np.array([self.index[left] for left, _ in targets], dtype=np.int64)
+        self.right = np.array([self.index[right] for _, right in targets], dtype=np.int64)
+        self.go_left = [instruction == "L" for instruction in self.instructions]
+        self.is_goal = np.array([name.endswith("Z") for name in self.names], dtype=bool)
+        self.__compile_pass()
+
+    def __compile_pass(self):
+        # For every node: the node reached after one pass over all
+        # instructions, and the first step of that pass (1 to
+        # len(instructions)) reaching ZZZ or any goal (node ending with Z), 0
+        # if none.
+        nodes = np.arange(len(self.names))
+        self.first_zzz = np.zeros(len(self.names), dtype=np.int64)
+        self.first_goal = np.zeros(len(self.names), dtype=np.int64)
+        zzz = self.index.get("ZZZ", -1)
+        for step, go_left in enumerate(self.go_left, 1):
+            nodes = self.left[nodes] if go_left else self.right[nodes]
+            self.first_zzz[(self.first_zzz == 0) & (nodes == zzz)] = step
+            self.first_goal[(self.first_goal == 0) & self.is_goal[nodes]] = step
+        self.pass_end = nodes
 
     def get_answer1(self):
+        # One lookup per pass over all instructions
         steps = 0
-        currentNode = "AAA"
-        while True:
-            instruction = self.instructions[self.ip]
-            neighbors = self.graph[currentNode]
-            currentNode = neighbors[0] if instruction == "L" else neighbors[1]
-            steps += 1
-            self.ip = (self.ip + 1) % len(self.instructions)
-            if currentNode == "ZZZ":
-                return steps
-
-    def get_answer2(self):
-        currentNodes = [node for node in self.graph.keys() if node.endswith("A")]
-        total_potential_goal_steps = [None] * len(currentNodes)
-        cycle_length = [None] * len(currentNodes)
-
-        for i, startNode in enumerate(currentNodes):
-            currentNode = startNode
-            potential_goal_steps = []
-            steps = 0
-            while True:
-                instruction = self.instructions[self.ip]
-                neighbor_index = 0 if instruction == "L" else 1
-                currentNode = self.graph[currentNode][neighbor_index]
-                steps += 1
-                self.ip = (self.ip + 1) % len(self.instructions)
-                if currentNode[2] == "Z":
-                    finished = False
-                    if any(map(lambda s: s[0] == currentNode, potential_goal_steps)):
-                        finished = True
-                    potential_goal_steps.append((currentNode, steps))
-                    # Ends by revisiting a potential goal
-                    # Every start node only has one potential goal.
-                    if finished == True:
-                        total_potential_goal_steps[i] = potential_goal_steps
-                        break
-                elif currentNode == startNode:
-                    # Ends with stepping on start node again
-                    # => Didn't happen with my input.
-                    cycle_length[i] = steps
-                    total_potential_goal_steps[i] = potential_goal_steps
-                    break
-        # My outputs:
-        # len(self.instructions): 263
-        # cycle_length: [None, None, None, None, None, None]
-        # total_potential_goal_steps:  [[('HMZ', 20777), ('HMZ', 41554)],
-        #  [('ZZZ', 18673), ('ZZZ', 37346)], [('RNZ', 13939), ('RNZ', 27878)],
-        #  [('XKZ', 17621), ('XKZ', 35242)], [('LFZ', 19199), ('LFZ', 38398)],
-        #  [('DDZ', 12361), ('DDZ', 24722)]]
-        print("len(self.instructions):", len(self.instructions))
-        print("cycle_length:", cycle_length)
-        print("total_potential_goal_steps: ", total_potential_goal_steps)
-
-        for i, pgs in enumerate(total_potential_goal_steps):
-            assert (pgs[1][1] - pgs[0][1]) % len(self.instructions) == 0
-            # My outputs:
-            # 79 0 79
-            # 71 0 71
-            # 53 0 53
-            # 67 0 67
-            # 73 0 73
-            # 47 0 47
-            a = pgs[0][1] // len(self.instructions)
-            b = pgs[0][1] % len(self.instructions)
-            c = (pgs[1][1] - pgs[0][1]) // len(self.instructions)
-            print(a, b, c)
-            assert a == c
-            assert b == 0
-            pgs[0][1] % len(self.instructions)
-
-        instructions_length = len(self.instructions)
-        total_potential_goal_cycles = []
-        for c in total_potential_goal_steps:
-            temp = [
-                (c[0][1] // instructions_length),
-                ((c[1][1] - c[0][1]) // instructions_length),
-            ]
-            total_potential_goal_cycles.append(temp)
-        # My outputs:
-        # [[79, 79], [71, 71], [53, 53], [67, 67], [73, 73], [47, 47]]
-        print(total_potential_goal_cycles)
-
-        # Find LCM of these cycles and multiply it with instruction length
-        cycles, _ =  zip(*total_potential_goal_cycles)
-        lcm = math.lcm(*cycles)
-        return lcm * instructions_length
+        currentNode = self.index["AAA"]
+        for _ in range(len(self.names)):
+            if self.first_zzz[currentNode] > 0:
+                return steps + int(self.first_zzz[currentNode])
+            currentNode = self.pass_end[currentNode]
+            steps += len(self.instructions)
+        raise AssertionError("ZZZ cannot be reached!")
+
+    def graph_table(self):
+        # Rows as expected by ghost_cycle
+        return np.stack([self.left, self.right, self.is_goal.astype(np.int64), self.pass_end, self.first_goal])
+
+    def ghost_cycles(self, starts, workers=0):
+        if workers == 0 or len(starts) == 0:
+            graph = self.graph_table().tolist()
+            return [ghost_cycle(graph, self.go_left, start) for start in starts]
+        # The workers read the graph from shared memory instead of getting a
+        # copy each.
+        table = self.graph_table()
+        memory = shared_memory.SharedMemory(create=True, size=table.nbytes)
+        try:
+            np.ndarray(table.shape, dtype=np.int64, buffer=memory.buf)[:] = table
+            with concurrent.futures.ProcessPoolExecutor(
+                workers, initializer=attach_graph, initargs=(memory.name, table.shape[1], self.go_left)
+            ) as executor:
+                return list(executor.map(worker_ghost_cycle, starts))
+        finally:
+            memory.close()
+            memory.unlink()
+
+    def get_answer2(self, workers=0):
+        # Cycle of every ghost (in parallel with workers > 0), combined by CRT
+        starts = [i for i, name in enumerate(self.names) if name.endswith("A")]
+        return earliest_common_step(self.ghost_cycles(starts, workers))
+
+
+def parse_input(lines):
+    return Map(lines)
+
+
+def part1(quiz_map):
+    return quiz_map.get_answer1()
+
+
+def part2(quiz_map):
+    return quiz_map.get_answer2()
+
+
+# Ghosts on a worker process per CPU, a variant for benchmark.py
+def parse_input_workers(lines):
+    return parse_input(lines)
+
+
+def part1_workers(quiz_map):
+    return part1(quiz_map)
+
+
+def part2_workers(quiz_map):
+    return quiz_map.get_answer2(os.cpu_count())
 
 
 def main():
     start_time = time.time()
-    with open(os.path.join(os.path.dirname(__file__), "input.txt"), "r") as f:
-        lines = list(map(lambda s: s.replace("\n", ""), f.readlines()))
-    quiz_map = Map(lines)
+
+    # With --workers=N, the ghosts of part 2 are walked by N processes.
+    args = loader.parse_args(workers=True)
+    workers = args.workers
+
+    with loader.open_input(__file__, args.argv) as f:
+        quiz_map = parse_input(f)
 
     print("Question 1: How many steps are required to reach ZZZ?")
-    print(f"Answer: {quiz_map.get_answer1()}")
+    print(f"Answer: {part1(quiz_map)}")
     print(
         "Question 2: How many steps does it take before you're only on nodes"
         " that end with Z?"
     )
-    print(f"Answer: {quiz_map.get_answer2()}")
+    print(f"Answer: {quiz_map.get_answer2(workers)}")
     print(f"Time elapsed: {time.time() - start_time} s")
 
 
@@ -1,11 +1,20 @@
 """ Advent of Code 2023, Day 9
     Day 9: Mirage Maintenance
     Author: Chi-Kit Pao
+    REMARK: Requires numpy to run this program.
 """
 
+import collections
+import functools
+import math
+import numpy as np
 import os
+import sys
 import time
 
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from common import loader
+
 
 def extrapolate(in_list):
     assert len(in_list) >= 1
@@ -22,20 +31,78 @@ def extrapolate(in_list):
     return out_list
 
 
-def main():
-    start_time = time.time()
-    with open(os.path.join(os.path.dirname(__file__), "input.txt"), "r") as f:
-        lines = list(map(lambda s: s.replace("\n", ""), f.readlines()))
+@functools.lru_cache
+def weights(length):
+    """ Weights of the values of a sequence for its next and its previous
+        value: binomial coefficients with alternating signs. The extrapolation
+        makes the difference of order length of the extended sequence 0.
+    """
+    next_weights = [(-1) ** (length - 1 - i) * math.comb(length, i) for i in range(length)]
+    previous_weights = [(-1) ** i * math.comb(length, i + 1) for i in range(length)]
+    return next_weights, previous_weights
+
+
+def extrapolated_sum(groups, direction):
+    # direction 0: next values, 1: previous values
+    total = 0
+    for length, matrix in groups.items():
+        w = weights(length)[direction]
+        # Exact with int64 if the sum of all products can't overflow, with
+        # Python integers otherwise.
+        bound = max(map(abs, w)) * length * len(matrix)
+        if matrix.dtype != object and bound * int(np.abs(matrix).max()) < 2**63:
+            total += int((matrix @ np.array(w, dtype=np.int64)).sum())
+        else:
+            total += int((matrix.astype(object) @ np.array(w, dtype=object)).sum())
+    return total
+
+
+def parse_input(lines):
+    """ Returns the sequences as matrices grouped by length: {length: matrix}. """
+    groups = collections.defaultdict(list)
+    for line in loader.iter_lines(lines):
+        values = line.split()
+        if len(values) > 0:
+            groups[len(values)].append(values)
+    result = dict()
+    for length, rows in groups.items():
+        try:
+            result[length] = np.array(rows, dtype=np.int64)
+        except OverflowError:
+            result[length] = np.array([list(map(int, row)) for row in rows], dtype=object)
+    return result
+
+
+def part1(groups):
+    return extrapolated_sum(groups, 0)
+
+
+def part2(groups):
+    return extrapolated_sum(groups, 1)
+
+
+def parse_input_recursive(lines):
     data = []
-    for line in lines:
+    for line in loader.iter_lines(lines):
         data.append(list(map(int, line.split())))
+    return data
+
+
+def part1_recursive(data):
+    return sum([extrapolate(d)[-1] for d in data])
+
+
+def part2_recursive(data):
+    return sum([extrapolate(d)[0] for d in data])
+
+
+def main():
+    start_time = time.time()
+    with loader.open_input(__file__) as f:
+        data = parse_input(f)
 
-    result1 = 0
-    result2 = 0
-    for d in data:
-        values = extrapolate(d)
-        result1 += values[-1]
-        result2 += values[0]
+    result1 = part1(data)
+    result2 = part2(data)
 
     print("Question 1: What is the sum of these extrapolated next values?")
     print(f"Answer: {result1}")
@@ -4,12 +4,16 @@
 """
 
 import os
+import sys
 import time
 
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from common import loader
+
 
 class Maze:
     def __init__(self, lines):
-        self.map = lines
+        self.map = loader.read_lines(lines)
         self.simple_map = []
         self.row_count = len(self.map)
         self.col_count = len(self.map[0])
@@ -126,16 +130,27 @@ class Maze:
         return result
 
 
+def parse_input(lines):
+    return Maze(lines)
+
+
+def part1(maze):
+    assert maze.step_count % 2 == 0
+    return maze.step_count // 2
+
+
+def part2(maze):
+    return maze.count_enclosed_tiles()
+
+
 def main():
     start_time = time.time()
 
-    with open(os.path.join(os.path.dirname(__file__), "input.txt"), "r") as f:
-        lines = list(map(lambda s: s.replace("\n", ""), f.readlines()))
-    maze = Maze(lines)
+    with loader.open_input(__file__) as f:
+        maze = parse_input(f)
 
-    assert maze.step_count % 2 == 0
-    result1 = maze.step_count // 2
-    result2 = maze.count_enclosed_tiles()
+    result1 = part1(maze)
+    result2 = part2(maze)
 
     print(
         "Question 1: How many steps along the loop does it take to get from the starting position to the point farthest from the starting position?"
@@ -5,8 +5,12 @@
 
 import itertools
 import os
+import sys
 import time
 
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from common import loader
+
 
 def get_sum(galaxies, empty_rows, empty_columns, factor):
     total = 0
@@ -38,11 +42,8 @@ def get_sum(galaxies, empty_rows, empty_columns, factor):
     return total
 
 
-def main():
-    start_time = time.time()
-
-    with open(os.path.join(os.path.dirname(__file__), "input.txt"), "r") as f:
-        lines = list(map(lambda s: s.replace("\n", ""), f.readlines()))
+def parse_input(lines):
+    lines = loader.read_lines(lines)
     empty_rows = []
     empty_columns = []
     row_count = len(lines[0])
@@ -63,9 +64,27 @@ def main():
                 break
         else:
             empty_columns.append(col)
+    return galaxies, empty_rows, empty_columns
+
+
+def part1(image):
+    galaxies, empty_rows, empty_columns = image
+    return get_sum(galaxies, empty_rows, empty_columns, 2)
+
+
+def part2(image):
+    galaxies, empty_rows, empty_columns = image
+    return get_sum(galaxies, empty_rows, empty_columns, 10**6)
+
+
+def main():
+    start_time = time.time()
+
+    with loader.open_input(__file__) as f:
+        image = parse_input(f)
 
-    result1 = get_sum(galaxies, empty_rows, empty_columns, 2)
-    result2 = get_sum(galaxies, empty_rows, empty_columns, 10**6)
+    result1 = part1(image)
+    result2 = part2(image)
 
     print(
         "Question 1: Expand the universe, then find the length of the shortest \n"
@@ -5,10 +5,15 @@
 
 import functools
 import os
+import sys
 import time
 
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from common import loader
+
 
 def parse_line(line):
+    line = loader.to_str(line)
     pattern, p2 = line.split()
     number_values = eval(f"({p2})")
     return pattern, number_values
@@ -72,26 +77,27 @@ def test_pattern(pattern, damages):
     return result
 
 
-def main():
-    start_time = time.time()
-
-    with open(os.path.join(os.path.dirname(__file__), "input.txt"), "r") as f:
-        lines = list(map(lambda s: s.replace("\n", ""), f.readlines()))
-
-    # Part 1
+def parse_input(lines):
     pattern_list = []
     damages_list = []
-    for line in lines:
+    for line in loader.iter_lines(lines):
         pattern, damages = parse_line(line)
         pattern_list.append(pattern)
         damages_list.append(damages)
+    return pattern_list, damages_list
 
-    result1 = 0
+
+def part1(records):
+    pattern_list, damages_list = records
+    result = 0
     for i in range(len(pattern_list)):
         temp = test_pattern(pattern_list[i], damages_list[i])
-        result1 += temp
+        result += temp
+    return result
+
 
-    # Part 2
+def part2(records):
+    pattern_list, damages_list = records
     pattern_list2 = []
     damages_list2 = []
     for i in range(len(pattern_list)):
@@ -100,10 +106,21 @@ def main():
         damages2 = damages_list[i] * 5
         damages_list2.append(damages2)
 
-    result2 = 0
+    result = 0
     for i in range(len(pattern_list2)):
         temp = test_pattern(pattern_list2[i], damages_list2[i])
-        result2 += temp
+        result += temp
+    return result
+
+
+def main():
+    start_time = time.time()
+
+    with loader.open_input(__file__) as f:
+        records = parse_input(f)
+
+    result1 = part1(records)
+    result2 = part2(records)
 
     print(
         "Question 1: For each row, count all of the different arrangements of\n"
@@ -4,8 +4,12 @@
 """
 
 import os
+import sys
 import time
 
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from common import loader
+
 
 class Map:
     def __init__(self):
@@ -69,14 +73,10 @@ class Map:
         return result
 
 
-def main():
-    start_time = time.time()
-
-    with open(os.path.join(os.path.dirname(__file__), "input.txt"), "r") as f:
-        lines = list(map(lambda s: s.replace("\n", ""), f.readlines()))
+def parse_input(lines):
     maps = []
     current_map = None
-    for line in lines:
+    for line in loader.iter_lines(lines):
         if len(line) > 0:
             if current_map is None:
                 current_map = Map()
@@ -90,20 +90,35 @@ def main():
     if current_map is not None:
         current_map.calculate_hashes()
         maps.append(current_map)
+    return maps
+
 
-    # Part 1
-    result1 = 0
+def part1(maps):
+    result = 0
     for map_ in maps:
         row, column = map_.find_mirror()
         assert (row, column).count(0) == 1
-        result1 += row * 100 + column
+        result += row * 100 + column
+    return result
+
 
-    # Part2
-    result2 = 0
+def part2(maps):
+    result = 0
     for map_ in maps:
         row, column = map_.find_smudge_mirror()
         assert (row, column).count(0) == 1
-        result2 += row * 100 + column
+        result += row * 100 + column
+    return result
+
+
+def main():
+    start_time = time.time()
+
+    with loader.open_input(__file__) as f:
+        maps = parse_input(f)
+
+    result1 = part1(maps)
+    result2 = part2(maps)
 
     print(
         "Question 1: Find the line of reflection in each of the patterns in\n"
@@ -5,8 +5,12 @@
 
 import functools
 import os
+import sys
 import time
 
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from common import loader
+
 @functools.cache
 def line_hash(line):
     row_value = 0
@@ -22,6 +26,7 @@ class Map:
     NORTH = 3
 
     def __init__(self, lines):
+        lines = loader.read_lines(lines)
         self.cube_map = []
         self.round_map = []
         self.column_count = len(lines[0])
@@ -96,6 +101,10 @@ class Map:
             current += delta
 
 
+def parse_input(lines):
+    return loader.read_lines(lines)
+
+
 def part1(lines):
     map_ = Map(lines)
     map_.tilt(Map.NORTH)
@@ -138,8 +147,8 @@ def part2(lines):
 def main():
     start_time = time.time()
 
-    with open(os.path.join(os.path.dirname(__file__), "input.txt"), "r") as f:
-        lines = list(map(lambda s: s.replace("\n", ""), f.readlines()))
+    with loader.open_input(__file__) as f:
+        lines = parse_input(f)
 
     result1 = part1(lines)
     print(
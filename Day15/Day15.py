@@ -4,8 +4,12 @@
 """
 
 import os
+import sys
 import time
 
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from common import loader
+
 
 def hash(token):
     result = 0
@@ -16,6 +20,16 @@ def hash(token):
     return result
 
 
+def parse_input(lines):
+    lines = loader.read_lines(lines)
+    assert len(lines) == 1
+    return lines[0].split(",")
+
+
+def part1(tokens):
+    return sum([hash(token) for token in tokens])
+
+
 def part2(tokens):
     boxes = []
     for _ in range(256):
@@ -52,12 +66,10 @@ def part2(tokens):
 def main():
     start_time = time.time()
 
-    with open(os.path.join(os.path.dirname(__file__), "input.txt"), "r") as f:
-        lines = list(map(lambda s: s.replace("\n", ""), f.readlines()))
-    assert len(lines) == 1
-    tokens = lines[0].split(",")
+    with loader.open_input(__file__) as f:
+        tokens = parse_input(f)
 
-    result1 = sum([hash(token) for token in tokens])
+    result1 = part1(tokens)
     print(
         "Question 1: Run the HASH algorithm on each step in the initialization\n"
         " sequence. What is the sum of the results?"
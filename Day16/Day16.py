@@ -4,8 +4,12 @@
 """
 
 import os
+import sys
 import time
 
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from common import loader
+
 
 class Map:
     EAST = 0
@@ -14,7 +18,7 @@ class Map:
     NORTH = 3
 
     def __init__(self, lines):
-        self.map = lines
+        self.map = loader.read_lines(lines)
         self.row_count = len(self.map)
         self.column_count = len(self.map[0])
 
@@ -76,6 +80,14 @@ class Map:
         return []
 
 
+def parse_input(lines):
+    return Map(lines)
+
+
+def part1(map_):
+    return map_.track_beam(0, -1, Map.EAST)
+
+
 def part2(map_):
     result = 0
     for i in range(map_.row_count):
@@ -90,11 +102,10 @@ def part2(map_):
 def main():
     start_time = time.time()
 
-    with open(os.path.join(os.path.dirname(__file__), "input.txt"), "r") as f:
-        lines = list(map(lambda s: s.replace("\n", ""), f.readlines()))
-    map_ = Map(lines)
+    with loader.open_input(__file__) as f:
+        map_ = parse_input(f)
 
-    result1 = map_.track_beam(0, -1, Map.EAST)
+    result1 = part1(map_)
     print(
         "Question 1: With the beam starting in the top-left heading right,\n"
         " how many tiles end up being energized?"
@@ -6,8 +6,12 @@
 from collections import defaultdict
 import functools
 import os
+import sys
 import time
 
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from common import instrument, loader
+
 @functools.cache
 def heuristic(row1, col1, row2, col2):
     return abs(row2 - row1) + abs(col2 - col1)
@@ -42,14 +46,15 @@ class Map:
     NORTH = 3
 
     def __init__(self, lines):
-        self.map = lines
+        self.map = loader.read_lines(lines)
         self.row_count = len(self.map)
         self.column_count = len(self.map[0])
         self.nodes = dict()
         self.nodes_pos = defaultdict(list)
 
     def calculate_heat_loss1(self):
-        self.__init_map1()
+        with instrument.span("init map"):
+            self.__init_map1()
         node1 = self.nodes[(0, 1, Map.EAST, 1)]
         node1.state = MapNode.VISITING
         node1.total_cost = node1.own_cost
@@ -58,19 +63,24 @@ class Map:
         node2.total_cost = node2.own_cost
 
         candidates = [node1, node2]
+        expanded = 0
         while len(candidates) > 0:
             # process best candidate
             candidates.sort(key=lambda c: c.total_cost)
             best_candidate = candidates.pop(0)
 
             if best_candidate.row == self.row_count - 1 and best_candidate.col == self.column_count - 1:
+                instrument.count("day17 nodes expanded", expanded)
                 return best_candidate.total_cost
             
+            expanded += 1
             self.__process1(candidates, best_candidate)
+        instrument.count("day17 nodes expanded", expanded)
         return -1
     
     def calculate_heat_loss2(self):
-        self.__init_map2()
+        with instrument.span("init map"):
+            self.__init_map2()
         candidates = []
         for i in range(4, 11):
             node1 = self.nodes[(0, i, Map.EAST, -1)]
@@ -82,15 +92,19 @@ class Map:
             candidates.append(node1)
             candidates.append(node2)
 
+        expanded = 0
         while len(candidates) > 0:
             # process best candidate
             candidates.sort(key=lambda c: (c.total_cost + heuristic(c.row, c.col, self.row_count - 1, self.column_count - 1)))
             best_candidate = candidates.pop(0)
 
             if best_candidate.row == self.row_count - 1 and best_candidate.col == self.column_count - 1:
+                instrument.count("day17 nodes expanded", expanded)
                 return best_candidate.total_cost
             
+            expanded += 1
             self.__process2(candidates, best_candidate)
+        instrument.count("day17 nodes expanded", expanded)
         return -1
 
     def valid_column(self, n):
@@ -231,15 +245,26 @@ class Map:
         return total_cost
 
 
+def parse_input(lines):
+    return Map(lines)
+
+
+def part1(map_):
+    return map_.calculate_heat_loss1()
+
+
+def part2(map_):
+    return map_.calculate_heat_loss2()
+
+
 def main():
     start_time = time.time()
 
-    with open(os.path.join(os.path.dirname(__file__), "input.txt"), "r") as f:
-        lines = list(map(lambda s: s.replace("\n", ""), f.readlines()))
-    map_ = Map(lines)
+    with loader.open_input(__file__) as f:
+        map_ = parse_input(f)
 
     start_time1 = time.time()
-    result1 = map_.calculate_heat_loss1()
+    result1 = part1(map_)
     print(
         "Question 1: Directing the crucible from the lava pool to the machine\n"
         " parts factory, but not moving more than three consecutive blocks in\n"
@@ -248,7 +273,7 @@ def main():
     print(f"Answer: {result1}")
     print(f"Time elapsed (part 1): {time.time() - start_time1} s")
 
-    result2 = map_.calculate_heat_loss2()
+    result2 = part2(map_)
     print(
         "Question 2: Directing the ultra crucible from the lava pool to the\n"
         " machine parts factory, what is the least heat loss it can incur?"
@@ -5,8 +5,12 @@
 
 import os
 import re
+import sys
 import time
 
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from common import loader
+
 
 def get_wall(points, row, col):
     if (row, col) not in points:
@@ -55,11 +59,9 @@ def count_enclosed_tiles(line):
     return inside_count
 
 
-def parse_input():
+def parse_input(lines):
     data = []
-    with open(os.path.join(os.path.dirname(__file__), "input.txt"), "r") as f:
-        lines = list(map(lambda s: s.replace("\n", ""), f.readlines()))
-    for line in lines:
+    for line in loader.iter_lines(lines):
         match = re.match(r"(?P<dir>\w) (?P<length>\d+) \(#(?P<color>\w+)\)", line)
         groupdict = match.groupdict()
         dir = groupdict["dir"]
@@ -166,7 +168,8 @@ def part2(data):
 
 def main():
     start_time = time.time()
-    data = parse_input()
+    with loader.open_input(__file__) as f:
+        data = parse_input(f)
 
     result1 = part1(data)
     print(
@@ -6,12 +6,11 @@
 import math
 import os
 import re
+import sys
 import time
 
-
-def debug(*args):
-    if True:
-        print(args)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from common import loader
 
 
 def make_ranges(x, m, a, s):
@@ -123,14 +122,11 @@ class Rule:
         return total
 
 
-def parse_input():
-    with open(os.path.join(os.path.dirname(__file__), "input.txt"), "r") as f:
-        lines = list(map(lambda s: s.replace("\n", ""), f.readlines()))
-
+def parse_input(lines):
     rule_objs = dict()
     parts = []
     is_rule = True
-    for line in lines:
+    for line in loader.iter_lines(lines):
         if is_rule:
             # Rules
             if len(line) == 0:
@@ -161,7 +157,8 @@ def parse_input():
     return rule_objs, parts
 
 
-def part1(rule_objs, parts):
+def part1(data):
+    rule_objs, parts = data
     result = 0
     for part in parts:
         response = rule_objs["in"].op(part)
@@ -172,7 +169,8 @@ def part1(rule_objs, parts):
     return result
 
 
-def part2(rule_objs):
+def part2(data):
+    rule_objs, _ = data
     return rule_objs["in"].op_range(
         rule_objs, make_ranges((1, 4001), (1, 4001), (1, 4001), (1, 4001))
     )
@@ -180,9 +178,10 @@ def part2(rule_objs):
 
 def main():
     start_time = time.time()
-    rule_objs, parts = parse_input()
+    with loader.open_input(__file__) as f:
+        data = parse_input(f)
 
-    result1 = part1(rule_objs, parts)
+    result1 = part1(data)
     print(
         "Question 1: Sort through all of the parts you've been given; what\n"
         " do you get if you add together all of the rating numbers for all\n"
@@ -190,7 +189,7 @@ def main():
     )
     print(f"Answer: {result1}")
 
-    result2 = part2(rule_objs)
+    result2 = part2(data)
     print(
         "Question 2: Consider only your list of workflows; the list of part\n"
         " ratings that the Elves wanted you to sort is no longer relevant.\n"
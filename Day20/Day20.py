@@ -6,12 +6,11 @@
 import math
 import os
 import re
+import sys
 import time
 
-
-def debug(*args):
-    if True:
-        print(args)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from common import instrument, loader
 
 
 class Module:
@@ -54,12 +53,9 @@ class Module:
                 self.send(o, out_value)
 
 
-def parse_input():
-    with open(os.path.join(os.path.dirname(__file__), "input.txt"), "r") as f:
-        lines = list(map(lambda s: s.replace("\n", ""), f.readlines()))
-
+def parse_input(lines):
     modules = dict()
-    for line in lines:
+    for line in loader.iter_lines(lines):
         # Example inputs
         # broadcaster -> pc, sg, qf, gt
         # %kz -> gl, vc
@@ -82,7 +78,16 @@ def parse_input():
     return modules
 
 
-def part1(modules, switch_count):
+def reset_states(modules):
+    # Both parts start with the default states, independent of each other.
+    for m in modules.values():
+        m.state = False
+        for name in m.inputs:
+            m.inputs[name] = False
+
+
+def part1(modules, switch_count=1000):
+    reset_states(modules)
     counters = [0, 0]
     queue = []
 
@@ -100,10 +105,12 @@ def part1(modules, switch_count):
             signal = queue.pop(0)
             if signal[1] in modules:
                 modules[signal[1]].react(signal[0], signal[2])
+    instrument.count("day20 pulses", counters[0] + counters[1])
     return counters[0] * counters[1]
 
 
 def part2(modules):
+    reset_states(modules)
     counters = [0, 0]  # irrelevant for part 2
     #conj_list = ["gr", "vc", "db", "lz"]
     conj_list = ["st", "tn", "hh", "dt"]
@@ -148,8 +155,9 @@ def part2(modules):
                             conj_check[signal[1]].append(switch_count)
             elif signal[1] == "rx":
                 if not signal[2]:
-                    print("rx Low")
+                    instrument.debug("rx Low")
                     # Will take a long time to reach here.
+                    instrument.count("day20 pulses", counters[0] + counters[1])
                     return switch_count
         #if all(map(lambda v: len(v) == sample_count, flip_flop_high.values())) and all(map(lambda v: len(v) == sample_count, flip_flop_low.values())):
         #    print(f"switch_count: {switch_count}\n flip_flop_high: {flip_flop_high}\n flip_flop_low: {flip_flop_low}")
@@ -157,7 +165,8 @@ def part2(modules):
             # Output:
             # switch_count: 20395
             #  conj_check: {'st': [3929, 7858, 11787, 15716, 19645], 'tn': [3863, 7726, 11589, 15452, 19315], 'hh': [3769, 7538, 11307, 15076, 18845], 'dt': [4079, 8158, 12237, 16316, 20395]}
-            print(f"switch_count: {switch_count}\n conj_check: {conj_check}")
+            instrument.debug(f"switch_count: {switch_count}\n conj_check: {conj_check}")
+            instrument.count("day20 pulses", counters[0] + counters[1])
             branch_cycle_lengths = []
             # Assert arithmetic progression
             for checks in conj_check.values():
@@ -169,9 +178,11 @@ def part2(modules):
 
 def main():
     start_time = time.time()
-    modules = parse_input()
+    with loader.open_input(__file__) as f:
+        lines = loader.read_lines(f)
+    modules = parse_input(lines)
 
-    result1 = part1(modules, 1000)
+    result1 = part1(modules)
     print(
         "Question 1: Consult your module configuration; determine the number\n"
         " of low pulses and high pulses that would be sent after pushing the\n"
@@ -182,7 +193,7 @@ def main():
     )
     print(f"Answer: {result1}")
 
-    result2 = part2(parse_input())
+    result2 = part2(modules)
     print(
       "Question 2:Reset all modules to their default states. Waiting for\n"
       " all pulses to be fully handled after each button press, what is\n"
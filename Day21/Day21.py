@@ -5,12 +5,11 @@
 
 from collections import defaultdict
 import os
+import sys
 import time
 
-
-def debug(*args):
-    if False:
-        print(*args)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from common import instrument, loader
 
 
 class Map:
@@ -20,6 +19,7 @@ class Map:
     NORTH = 3
 
     def __init__(self, lines):
+        lines = loader.read_lines(lines)
         self.map = []
         self.column_count = len(lines[0])
         self.row_count = len(lines)
@@ -32,6 +32,10 @@ class Map:
                     self.start_pos = (len(self.map) - 1, start)
 
 
+def parse_input(lines):
+    return Map(lines)
+
+
 def part1(map_):
     offsets = [(0, 1), (1, 0), (0, -1), (-1, 0)]
     current_positions = {map_.start_pos}
@@ -107,7 +111,7 @@ def part2(map_):
     remaining_steps = (max_steps - (map_.column_count - 1 - map_.start_pos[1])) % map_.column_count
     # Output:
     # remaining_steps 0
-    debug(f"remaining_steps {remaining_steps}")
+    instrument.debug(f"remaining_steps {remaining_steps}")
     
     milestones = [i * map_.column_count - 1 - map_.start_pos[1] + remaining_steps for i in range(1, 4)]
     last_correct_step = 2
@@ -139,9 +143,10 @@ def part2(map_):
             # steps 458 count 188468
             # steps 589 count 311081
             # steps 720 count 464256
-            debug(f"steps {steps} count {len(new_positions)}")
-            for y in range(map_y_boundries[0], map_y_boundries[1] + 1):
-                debug([f"{count_in_maps[(y, x)]:>4}" for x in range(map_x_boundries[0], map_x_boundries[1] + 1)])
+            if instrument.enabled:
+                instrument.debug(f"steps {steps} count {len(new_positions)}")
+                for y in range(map_y_boundries[0], map_y_boundries[1] + 1):
+                    instrument.debug([f"{count_in_maps[(y, x)]:>4}" for x in range(map_x_boundries[0], map_x_boundries[1] + 1)])
             if steps == milestones[last_correct_step]:
                 for y in range(map_y_boundries[0], map_y_boundries[1] + 1):
                     last_count_in_maps.append([count_in_maps[(y, x)] for x in range(map_x_boundries[0], map_x_boundries[1] + 1)])
@@ -155,16 +160,14 @@ def part2(map_):
 def main():
     start_time = time.time()
 
-    with open(os.path.join(os.path.dirname(__file__), "input.txt"), "r") as f:
-        lines = list(map(lambda s: s.replace("\n", ""), f.readlines()))
-
-    map_ = Map(lines)
+    with loader.open_input(__file__) as f:
+        map_ = parse_input(f)
 
     # Output: 
     # Dimension: (131, 131)
     # Start position: (65, 65))
-    debug(f"Dimension: ({map_.row_count}, {map_.column_count})")
-    debug(f"Start position: {map_.start_pos}")
+    instrument.debug(f"Dimension: ({map_.row_count}, {map_.column_count})")
+    instrument.debug(f"Start position: {map_.start_pos}")
     # Assert map is quadratic:
     map_.row_count == map_.column_count 
     # Assert start position is centric:
@@ -6,12 +6,11 @@
 from collections import defaultdict
 import copy
 import os
+import sys
 import time
 
-
-def debug(*args):
-    if True:
-        print(*args)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from common import instrument, loader
 
 
 class Brick:
@@ -67,7 +66,7 @@ class Brick:
         return self.__repr__()
 
 
-def parse_input(lines):
+def parse_bricks(lines):
     bricks = []
     min_values = [0, 0, 0]
     max_values = [0, 0, 0]
@@ -77,7 +76,7 @@ def parse_input(lines):
 
     # Example inputs
     # 1,0,1~1,2,1
-    for id, line in enumerate(lines, 1):
+    for id, line in enumerate(loader.iter_lines(lines), 1):
         s1, s2 = line.split("~")
         p1 = to_point(s1)
         p2 = to_point(s2)
@@ -111,11 +110,11 @@ def check_dropped_bricks(fixed_bricks, bricks):
             bricks_dict[brick.id].append(pos)
             bricks_count += 1
     if fixed_bricks_count != bricks_count:
-        debug(f"fixed_bricks_count {fixed_bricks_count} != bricks_count {bricks_count}")
+        instrument.debug(f"fixed_bricks_count {fixed_bricks_count} != bricks_count {bricks_count}")
         for k, v1 in bricks_dict.items():
             v2 = fixed_bricks_dict[k]
             if len(v1) != len(v2):
-                debug(f"Difference {k}: {v1} {v2}")
+                instrument.debug(f"Difference {k}: {v1} {v2}")
 
 
 def drop_bricks(bricks, min_values, max_values):
@@ -138,6 +137,7 @@ def drop_bricks(bricks, min_values, max_values):
         if brick.fixed:
             fix_brick(fixed_bricks, brick)
 
+    lowered = 0
     while True:
         handled = 0
         for height in range(1, max_values[2] + 1):
@@ -157,18 +157,28 @@ def drop_bricks(bricks, min_values, max_values):
                             )
                         ):
                             brick.lower()
+                            lowered += 1
                         else:
                             fix_brick(fixed_bricks, brick)
                         handled += 1
         if handled == 0:
             break
+    instrument.count("day22 bricks lowered", lowered)
 
     check_dropped_bricks(fixed_bricks, bricks)
 
     return fixed_bricks
 
 
-def part1(fixed_bricks, bricks):
+def parse_input(lines):
+    bricks, min_values, max_values = parse_bricks(lines)
+    with instrument.span("drop bricks"):
+        fixed_bricks = drop_bricks(bricks, min_values, max_values)
+    return fixed_bricks, bricks
+
+
+def part1(data):
+    fixed_bricks, bricks = data
     # Find bricks not safe for disintegration (-> only brick to support another)
     unsafe = set()
     for brick in bricks:
@@ -253,7 +263,8 @@ def test_module(brick_id, modules_dict):
     result = sum([m.state for m in modules_dict.values()])
     return result
 
-def part2(fixed_bricks, bricks):
+def part2(data):
+    fixed_bricks, bricks = data
     supporting_bricks_dict = dict()
     supporting_bricks_set = set()
     supported_bricks = []
@@ -291,13 +302,10 @@ def part2(fixed_bricks, bricks):
 def main():
     start_time = time.time()
 
-    with open(os.path.join(os.path.dirname(__file__), "input.txt"), "r") as f:
-        lines = list(map(lambda s: s.replace("\n", ""), f.readlines()))
-
-    bricks, min_values, max_values = parse_input(lines)
-    fixed_bricks = drop_bricks(bricks, min_values, max_values)
+    with loader.open_input(__file__) as f:
+        data = parse_input(f)
 
-    result1 = part1(fixed_bricks, bricks)
+    result1 = part1(data)
     print(
         "Question 1: Figure how the blocks will settle based on the snapshot.\n"
         " Once they've settled, consider disintegrating a single brick; how\n"
@@ -305,7 +313,7 @@ def main():
     )
     print(f"Answer: {result1}")
 
-    result2 = part2(fixed_bricks, bricks)
+    result2 = part2(data)
     print(
         "Question 2: For each brick, determine how many other bricks would\n"
         " fall if that brick were disintegrated. What is the sum of the number\n"
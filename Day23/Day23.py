@@ -1,19 +1,20 @@
 """ Advent of Code 2023, Day 23
     Day 23: A Long Walk
     Author: Chi-Kit Pao
-    REMARK: Requires MatPlotLib, NetworkX and Numpy to run this program.
+    REMARK: Requires NetworkX to run this program, MatPlotLib and Numpy to
+     draw the graph.
 """
 
-import matplotlib.pyplot as plt
-import numpy as np
-import networkx as nx
 import os
+import sys
 import time
 
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from common import instrument, loader
+
+# Set to True to draw the graph of the junctions (part 1).
+DRAW_GRAPH = False
 
-def debug(*args):
-    if True:
-        print(*args)
 
 class Junction:
     def __init__(self, id_, pos, neighbors):
@@ -45,6 +46,7 @@ class Map:
     SLOPE_TILES = [">", "v", "<", "^"]
 
     def __init__(self, lines, consider_slopes):
+        lines = loader.read_lines(lines)
         self.map = lines
         self.column_count = len(lines[0])
         self.row_count = len(lines)
@@ -85,32 +87,28 @@ class Map:
                 if edge is not None:
                     self.connections[edge.node1, edge.node2] = edge
                     junction.junction_ids.append(edge.node2)
-        self.build_graph()
+        # Without slopes (part 2) the graph contains cycles, the longest path
+        # is searched with find_longest_path_dfs instead.
+        if self.consider_slopes:
+            self.build_graph()
 
     def build_graph(self):
+        import networkx as nx
+
         # Build graph
         graph = nx.DiGraph()
         graph.add_nodes_from([junction.pos for junction in self.junctions])
         for edge in self.connections.values():
             graph.add_edge(self.junctions[edge.node1].pos, self.junctions[edge.node2].pos, weight=edge.distance)
         
-        # Set node position
-        pos = dict()
-        nodes = set(graph)
-        for node in nodes:
-            pos[node] = np.array([node[1], node[0]])
-        nx.draw(graph, pos=pos, with_labels=True)
-        # nx.draw_networkx_edge_labels(graph, pos)
-        ax = plt.gca()
-        ax.set_axis_off()
-        # Uncomment this line to show the graph.
-        # plt.show()
+        if DRAW_GRAPH:
+            draw_graph(graph)
 
         try:
             longest_path = nx.dag_longest_path(graph)
             self.longest_path_length = nx.dag_longest_path_length(graph)
             # Output: [(0, 1), (13, 5), (11, 43), (15, 53), (7, 85), (5, 103), (35, 103), (33, 127), (67, 127), (83, 125), (103, 129), (131, 137), (140, 139)]
-            debug("longest_path", longest_path)
+            instrument.debug("longest_path", longest_path)
         except nx.exception.NetworkXUnfeasible:
             # Handle exception for Part 2:
             # networkx.exception.NetworkXUnfeasible: Graph contains a cycle or graph changed during iteration
@@ -165,14 +163,33 @@ class Map:
         return Edge(junction.id, next_junction.id, distance)
 
 
+def draw_graph(graph):
+    import matplotlib.pyplot as plt
+    import networkx as nx
+    import numpy as np
+
+    # Set node position
+    pos = dict()
+    nodes = set(graph)
+    for node in nodes:
+        pos[node] = np.array([node[1], node[0]])
+    nx.draw(graph, pos=pos, with_labels=True)
+    # nx.draw_networkx_edge_labels(graph, pos)
+    ax = plt.gca()
+    ax.set_axis_off()
+    plt.show()
+
+
 # [total distance, list with junction IDs]
 current_longest_path = None
 
 def find_longest_path_dfs(map_, junction, path):
     """ Recursive function to find the longest path using Depth-first search.
+        Returns the number of calls.
     """
     global current_longest_path
 
+    calls = 1
     # junction before end
     if map_.end_junction_id in junction.junction_ids:
         path.append(map_.end_junction_id)
@@ -182,35 +199,33 @@ def find_longest_path_dfs(map_, junction, path):
         if current_longest_path is None or current_longest_path[0] < total_distance:
             current_longest_path = [total_distance, path.copy()]
         path.pop(-1)
-        return
+        return calls
 
     for id_ in junction.junction_ids:
         if id_ in path:
             continue
         path.append(id_)
-        find_longest_path_dfs(map_, map_.junctions[id_], path)
+        calls += find_longest_path_dfs(map_, map_.junctions[id_], path)
         path.pop(-1)
+    return calls
 
 
-def main():
-    start_time = time.time()
+def parse_input(lines):
+    return loader.read_lines(lines)
 
-    with open(os.path.join(os.path.dirname(__file__), "input.txt"), "r") as f:
-        lines = list(map(lambda s: s.replace("\n", ""), f.readlines()))
 
+def part1(lines):
     map_ = Map(lines, True)
+    return map_.longest_path_length
 
-    print(
-        "Question 1: Find the longest hike you can take through the hiking\n"
-        " trails listed on your map. How many steps long is the longest hike?"
-    )
-    print(f"Answer: {map_.longest_path_length}")
 
+def part2(lines):
+    global current_longest_path
+    current_longest_path = None
     map_ = Map(lines, False)
-    find_longest_path_dfs(map_, map_.junctions[map_.start_junction_id], 
+    calls = find_longest_path_dfs(map_, map_.junctions[map_.start_junction_id], 
                                     [map_.start_junction_id])
-    global current_longest_path
-    result2 = current_longest_path[0]
+    instrument.count("day23 dfs calls", calls)
     # Output:
     # Longest path: [(0, 1), (13, 5), (11, 43), (15, 53), (7, 85), (33, 85), 
     #  (53, 79), (57, 109), (35, 103), (5, 103), (33, 127), (67, 127), 
@@ -218,7 +233,23 @@ def main():
     #  (111, 65), (103, 35), (87, 39), (63, 29), (63, 53), (37, 59), (39, 31), 
     #  (43, 5), (59, 13), (89, 13), (105, 15), (123, 33), (133, 61), (123, 79), 
     #  (127, 103), (131, 137), (140, 139)]
-    debug("Longest path:", [map_.junctions[id_].pos for id_ in current_longest_path[1]])
+    instrument.debug("Longest path:", [map_.junctions[id_].pos for id_ in current_longest_path[1]])
+    return current_longest_path[0]
+
+
+def main():
+    start_time = time.time()
+
+    with loader.open_input(__file__) as f:
+        lines = parse_input(f)
+
+    print(
+        "Question 1: Find the longest hike you can take through the hiking\n"
+        " trails listed on your map. How many steps long is the longest hike?"
+    )
+    print(f"Answer: {part1(lines)}")
+
+    result2 = part2(lines)
     print(
         "Question 2: Find the longest hike you can take through the\n"
         " surprisingly dry hiking trails listed on your map. How many steps\n"
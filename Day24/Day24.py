@@ -8,13 +8,11 @@ import copy
 import itertools
 import numpy as np
 import os
-import sympy as sp
+import sys
 import time
 
-
-def debug(*args):
-    if False:
-        print(*args)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from common import instrument, loader
 
 
 class Hailstone:
@@ -31,6 +29,7 @@ class Hailstone:
 
 
 def parse_line(id_, line):
+    line = loader.to_str(line)
     # Example input
     # 230027994633462, 224850233272831, 164872865225455 @ 103, -57, 285
     p1, p2 = line.split(" @ ")
@@ -39,6 +38,13 @@ def parse_line(id_, line):
     return Hailstone(id_, pos, v)
 
 
+def parse_input(lines):
+    hailstones = []
+    for i, line in enumerate(loader.iter_lines(lines), 1):
+        hailstones.append(parse_line(i, line))
+    return hailstones
+
+
 def part1(hailstones):
     total = 0
     for c in itertools.combinations(hailstones, 2):
@@ -68,7 +74,7 @@ def part1(hailstones):
             #  v=(-89, 309, 220)) and Hailstone(id=269, pos=(218075316045983, 275317801447459, 264760038336981), v=(178, -618, -228))
             # numpy.linalg.LinAlgError for hailstones Hailstone(id=260, pos=(298167626012347, 343890784063423, 423675682350779),
             #  v=(34, 34, -34)) and Hailstone(id=275, pos=(232442233530894, 174047813539401, 130419194940021), v=(95, 95, 411))
-            # debug(f"numpy.linalg.LinAlgError for hailstones {c[0]} and {c[1]}")
+            # instrument.debug(f"numpy.linalg.LinAlgError for hailstones {c[0]} and {c[1]}")
             continue
 
         if x[0] < 0 or x[1] < 0:
@@ -114,6 +120,9 @@ def part2(hailstones):
     #
     # We will get 6 similar equations (3 pairs * 2 equations) together when combining other coordinates with totally 3 hailstones.
 
+    # Only needed here, takes longer to import than the whole part 1.
+    import sympy as sp
+
     r0 = hailstones[0].pos
     r1 = hailstones[1].pos
     r2 = hailstones[2].pos
@@ -188,19 +197,15 @@ def part2(hailstones):
     system = sp.Matrix(tuple(matrix))
     solution = sp.solve_linear_system(system, syrr[0], syvr[0], syrr[1], syvr[1], syrr[2], syvr[2])
     # Output: {rrx: 231279746486542, vrx: 99, rry: 131907658181641, vry: 240, rrz: 195227847662645, vrz: 188}
-    debug(solution)
+    instrument.debug(solution)
     return solution[syrr[0]] + solution[syrr[1]] + solution[syrr[2]]
 
 
 def main():
     start_time = time.time()
 
-    hailstones = []
-
-    with open(os.path.join(os.path.dirname(__file__), "input.txt"), "r") as f:
-        lines = list(map(lambda s: s.replace("\n", ""), f.readlines()))
-    for i, line in enumerate(lines, 1):
-        hailstones.append(parse_line(i, line))
+    with loader.open_input(__file__) as f:
+        hailstones = parse_input(f)
 
     result1 = part1(hailstones)
     print(
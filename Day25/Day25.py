@@ -1,37 +1,40 @@
 """ Advent of Code 2023, Day 25
     Day 25: Snowverload
     Author: Chi-Kit Pao
-    REMARK: Requires MatPlotLib and NetworkX to run this program.
+    REMARK: Requires NetworkX to run this program and MatPlotLib to draw the
+     graph.
 """
 
-import matplotlib.pyplot as plt
-import networkx as nx
 import os
+import sys
 import time
 
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from common import loader
 
-def debug(*args):
-    if True:
-        print(*args)
+# Set to True to draw the graph.
+DRAW_GRAPH = False
 
 
-def main():
-    start_time = time.time()
+def parse_input(lines):
+    import networkx as nx
 
     edges = []
-
-    with open(os.path.join(os.path.dirname(__file__), "input.txt"), "r") as f:
-        lines = list(map(lambda s: s.replace("\n", ""), f.readlines()))
-        for line in lines:
-            start, p2 = line.split(":")
-            p2_list = p2.split()
-            for end in p2_list:
-                edges.append((start, end))
+    for line in loader.iter_lines(lines):
+        start, p2 = line.split(":")
+        p2_list = p2.split()
+        for end in p2_list:
+            edges.append((start, end))
 
     # Build graph
     graph = nx.Graph()
     for edge in edges:
         graph.add_edge(edge[0], edge[1])
+    return graph
+
+
+def part1(graph):
+    import networkx as nx
 
     # REMARK: Showed graph and stored it as "AoC2023Day25_Graph_before.png".
     # Figured out that these three edges shall be removed:
@@ -39,6 +42,12 @@ def main():
     graph.remove_edge("txf", "xnn")
     graph.remove_edge("jjn", "nhg")
     graph.remove_edge("lms", "tmc")
+    return len(nx.node_connected_component(graph, "gdd")) * len(nx.node_connected_component(graph, "qgn"))
+
+
+def draw_graph(graph):
+    import matplotlib.pyplot as plt
+    import networkx as nx
 
     nx.draw(graph, with_labels=True, node_color="blue")
     ax = plt.gca()
@@ -46,7 +55,18 @@ def main():
     plt.show()
     # plt.savefig(os.path.join(os.path.dirname(__file__), "test.png"))
 
-    result1 = len(nx.node_connected_component(graph, "gdd")) * len(nx.node_connected_component(graph, "qgn"))
+
+def main():
+    start_time = time.time()
+
+    with loader.open_input(__file__) as f:
+        graph = parse_input(f)
+
+    result1 = part1(graph)
+
+    if DRAW_GRAPH:
+        draw_graph(graph)
+
     print(
         "Question: Find the three wires you need to disconnect in order to\n"
         " divide the components into two separate groups. What do you get if\n"
@@ -0,0 +1,320 @@
+""" Advent of Code 2023, benchmark
+    Times parse_input, part1 and part2 of the DayNN solutions separately.
+
+    Usage examples:
+      python benchmark.py --days 1 2 3 --warm 5 --cold 2
+      python benchmark.py --save-baseline benchmark_baseline.json
+      python benchmark.py --check benchmark_baseline.json --tolerance 0.25
+      python benchmark.py --days 4 7 --scales 1 10 100 --seed 3
+      python benchmark.py --days 17 20 --profile profiles
+      python benchmark.py --days 2 --variants
+
+    Warm repetitions run in this process after one untimed warm-up run.
+    Cold repetitions start a new interpreter for every run and additionally
+    measure the import time of the module, the time of reading (or
+    generating) the input and the startup time (interpreter start and import
+    of this script).
+
+    With --scales the inputs are generated (see generators) instead of read
+    from the input.txt files, results are reported e.g. as "Day04@x10".
+
+    With --profile DIR every day is run twice more with instrumentation (see
+    common/instrument.py), with cProfile and with the call tracer. DIR
+    receives DayNN.pstats and the spans and function calls as collapsed
+    stacks for flame graphs (DayNN.folded, e.g. "Day17;part1;part1
+    (Day17.py:120);..."), the counters are added to the results.
+
+    Some days keep previous implementations for comparison as variants:
+    functions parse_input_NAME, part1_NAME and part2_NAME. --variants
+    benchmarks them too, reported e.g. as "Day02[per_line]".
+"""
+
+import argparse
+import contextlib
+import datetime
+import io
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+import types
+
+from common import days, instrument
+import generators
+
+PHASES = ["startup", "input", "import", "parse", "part1", "part2"]
+
+
+def percentile(values, q):
+    # Linear interpolation between closest ranks
+    values = sorted(values)
+    if len(values) == 1:
+        return values[0]
+    pos = (len(values) - 1) * q
+    lower = int(pos)
+    upper = min(lower + 1, len(values) - 1)
+    return values[lower] + (values[upper] - values[lower]) * (pos - lower)
+
+
+def summarize(values):
+    return {
+        "n": len(values),
+        "min": min(values),
+        "median": percentile(values, 0.5),
+        "p90": percentile(values, 0.9),
+        "p99": percentile(values, 0.99),
+        "max": max(values),
+    }
+
+
+def timed(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+
+def measure(module, lines):
+    # Every part gets its own freshly parsed data since some solutions modify
+    # their data (e.g. module states in Day 20). The time of these parses is
+    # recorded as "reparse", it is not reported.
+    timings = {"reparse": 0.0}
+    answers = []
+    with contextlib.redirect_stdout(io.StringIO()):
+        with instrument.span("parse"):
+            _, timings["parse"] = timed(module.parse_input, lines)
+        for part in ("part1", "part2"):
+            func = getattr(module, part, None)
+            if func is None:
+                continue
+            with instrument.span("reparse"):
+                data, reparse_time = timed(module.parse_input, lines)
+            timings["reparse"] += reparse_time
+            with instrument.span(part):
+                answer, timings[part] = timed(func, data)
+            answers.append(answer)
+    return timings, answers
+
+
+def input_lines(day, scale, seed):
+    if scale is None:
+        return days.read_lines(day)
+    return generators.generate_lines(day, scale, seed)
+
+
+def result_name(day, scale, variant=None):
+    name = days.day_name(day)
+    if variant is not None:
+        name += f"[{variant}]"
+    if scale is not None:
+        name += f"@x{scale:g}"
+    return name
+
+
+def variant_names(module):
+    return [name[len("parse_input_"):] for name in dir(module) if name.startswith("parse_input_")]
+
+
+def select_variant(module, variant):
+    if variant is None:
+        return module
+    functions = dict()
+    for func in ("parse_input", "part1", "part2"):
+        if hasattr(module, f"{func}_{variant}"):
+            functions[func] = getattr(module, f"{func}_{variant}")
+    return types.SimpleNamespace(**functions)
+
+
+def run_cold(day, scale, seed, variant=None):
+    # Executed in a fresh interpreter, see --worker.
+    with contextlib.redirect_stdout(io.StringIO()):
+        module, import_time = timed(days.load_day, day)
+    lines, input_time = timed(input_lines, day, scale, seed)
+    timings, answers = measure(select_variant(module, variant), lines)
+    timings["import"] = import_time
+    timings["input"] = input_time
+    return timings, answers
+
+
+def profile_day(day, scale, seed, directory, variant=None):
+    # Not timed, profiling slows everything down.
+    instrument.enable()
+    instrument.reset()
+    with contextlib.redirect_stdout(io.StringIO()):
+        module = select_variant(days.load_day(day), variant)
+    name = result_name(day, scale, variant)
+    lines = input_lines(day, scale, seed)
+    with instrument.span(name):
+        instrument.profile(os.path.join(directory, f"{name}.pstats"), measure, module, lines)
+    counters = dict(instrument.counters)
+    # The call stacks for the flame graph come from a second run, cProfile
+    # and the tracer can't run at the same time.
+    instrument.reset()
+    with instrument.span(name):
+        instrument.trace(measure, module, lines)
+    instrument.write_folded(os.path.join(directory, f"{name}.folded"))
+    instrument.enable(False)
+    return counters
+
+
+def run_worker(args):
+    return subprocess.run(
+        [sys.executable, os.path.abspath(__file__), "--worker"] + args,
+        capture_output=True,
+        check=True,
+        text=True,
+    ).stdout
+
+
+def benchmark_day(day, warm, cold, scale=None, seed=0, variant=None):
+    result = {"answers": None, "warm": dict(), "cold": dict()}
+
+    warm_timings = []
+    if warm > 0:
+        with contextlib.redirect_stdout(io.StringIO()):
+            module = select_variant(days.load_day(day), variant)
+        lines = input_lines(day, scale, seed)
+        _, result["answers"] = measure(module, lines)
+        for _ in range(warm):
+            timings, _ = measure(module, lines)
+            warm_timings.append(timings)
+
+    cold_timings = []
+    worker_args = [] if scale is None else ["--scales", str(scale), "--seed", str(seed)]
+    if variant is not None:
+        worker_args += ["--variant", variant]
+    for _ in range(cold):
+        output, wall_time = timed(run_worker, [str(day)] + worker_args)
+        worker_result = json.loads(output)
+        # Everything else the worker did is startup.
+        worker_result["timings"]["startup"] = wall_time - sum(worker_result["timings"].values())
+        cold_timings.append(worker_result["timings"])
+        result["answers"] = worker_result["answers"]
+
+    for mode, timings_list in (("warm", warm_timings), ("cold", cold_timings)):
+        for phase in PHASES:
+            values = [t[phase] for t in timings_list if phase in t]
+            if len(values) > 0:
+                result[mode][phase] = summarize(values)
+    return result
+
+
+def load_json(path, default):
+    if not os.path.exists(path):
+        return default
+    with open(path, "r") as f:
+        return json.load(f)
+
+
+def save_json(path, data):
+    with open(path, "w") as f:
+        json.dump(data, f, indent=2, default=str)
+
+
+def check_regressions(results, baseline, tolerance, min_delta):
+    # Compares medians against the baseline. Small absolute differences are
+    # ignored since they are dominated by noise.
+    regressions = []
+    for day, result in results.items():
+        if day not in baseline:
+            continue
+        for mode in ("warm", "cold"):
+            for phase, stats in result[mode].items():
+                base_stats = baseline[day].get(mode, dict()).get(phase)
+                if base_stats is None:
+                    continue
+                current, previous = stats["median"], base_stats["median"]
+                if current > previous * (1 + tolerance) and current - previous > min_delta:
+                    regressions.append((day, mode, phase, previous, current))
+        if baseline[day].get("answers") not in (None, result["answers"]):
+            regressions.append((day, "answers", "-", baseline[day]["answers"], result["answers"]))
+    return regressions
+
+
+def print_report(results):
+    width = max([6] + [len(day) + 1 for day in results])
+    print(f"{'Day':<{width}}{'Mode':<6}{'Phase':<7}{'Median':>12}{'P90':>12}{'Max':>12}")
+    for day, result in results.items():
+        for mode in ("warm", "cold"):
+            for phase, stats in result[mode].items():
+                print(
+                    f"{day:<{width}}{mode:<6}{phase:<7}"
+                    f"{stats['median']:>12.6f}{stats['p90']:>12.6f}{stats['max']:>12.6f}"
+                )
+        for name, value in result.get("counters", dict()).items():
+            print(f"{day:<{width}}{name:<37}{value:>12}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the DayNN solutions.")
+    parser.add_argument("--days", type=int, nargs="+", default=days.DAYS)
+    parser.add_argument("--warm", type=int, default=3, help="warm repetitions")
+    parser.add_argument("--cold", type=int, default=1, help="cold repetitions")
+    parser.add_argument("--scales", type=float, nargs="+", help="use generated inputs of these scales")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the generated inputs")
+    parser.add_argument("--profile", metavar="DIR", help="write cProfile and flame graph data to DIR")
+    parser.add_argument("--variants", action="store_true", help="also benchmark previous implementations")
+    parser.add_argument("--history", default=os.path.join(days.ROOT_DIR, "benchmark_history.json"))
+    parser.add_argument("--save-baseline", metavar="PATH")
+    parser.add_argument("--check", metavar="BASELINE", help="fail on regressions against BASELINE")
+    parser.add_argument("--tolerance", type=float, default=0.25)
+    parser.add_argument("--min-delta", type=float, default=0.005, help="seconds")
+    parser.add_argument("--worker", type=int, help=argparse.SUPPRESS)
+    parser.add_argument("--variant", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker is not None:
+        scale = None if args.scales is None else args.scales[0]
+        timings, answers = run_cold(args.worker, scale, args.seed, args.variant)
+        print(json.dumps({"timings": timings, "answers": answers}, default=str))
+        return 0
+
+    results = dict()
+    for day in args.days:
+        variants = [None]
+        if args.variants:
+            with contextlib.redirect_stdout(io.StringIO()):
+                variants += variant_names(days.load_day(day))
+        for variant in variants:
+            for scale in args.scales or [None]:
+                name = result_name(day, scale, variant)
+                print(f"Benchmarking {name}...", file=sys.stderr)
+                results[name] = benchmark_day(day, args.warm, args.cold, scale, args.seed, variant)
+                if args.profile:
+                    os.makedirs(args.profile, exist_ok=True)
+                    results[name]["counters"] = profile_day(day, scale, args.seed, args.profile, variant)
+    # Answers of different types (e.g. NumPy or SymPy numbers) are stored as
+    # strings so that they can be compared with the stored baseline.
+    results = json.loads(json.dumps(results, default=str))
+    print_report(results)
+
+    history = load_json(args.history, [])
+    history.append(
+        {
+            "timestamp": datetime.datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "warm": args.warm,
+            "cold": args.cold,
+            "seed": args.seed,
+            "results": results,
+        }
+    )
+    save_json(args.history, history)
+
+    if args.save_baseline:
+        save_json(args.save_baseline, results)
+
+    if args.check:
+        regressions = check_regressions(
+            results, load_json(args.check, dict()), args.tolerance, args.min_delta
+        )
+        for day, mode, phase, previous, current in regressions:
+            print(f"REGRESSION {day} {mode} {phase}: {previous} -> {current}")
+        if len(regressions) > 0:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,3 @@
+""" Advent of Code 2023, common helpers
+    Shared code for tooling around the DayNN solutions.
+"""
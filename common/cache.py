@@ -0,0 +1,89 @@
+""" Advent of Code 2023, common helpers
+    Persistent cache of the answers in an SQLite database.
+
+    Entries are keyed by a hash of the solution source code, of the common
+    helpers and of the input, so that any change of them invalidates the
+    cached answers. The least recently used days are removed when there are
+    more than max_entries.
+"""
+
+import glob
+import hashlib
+import json
+import os
+import sqlite3
+import time
+
+from common import days, loader
+
+DEFAULT_PATH = os.path.join(days.ROOT_DIR, "results_cache.sqlite3")
+
+
+def file_hash(path):
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        h.update(f.read())
+    return h.hexdigest()
+
+
+def day_key(day):
+    # The days import the common helpers (loader, instrument, ...), so a
+    # change of any of them invalidates the cached answers as well.
+    common_paths = sorted(glob.glob(os.path.join(os.path.dirname(loader.__file__), "*.py")))
+    h = hashlib.sha256()
+    for path in (days.source_path(day), *common_paths, days.input_path(day)):
+        h.update(file_hash(path).encode() if os.path.exists(path) else b"-")
+    return h.hexdigest()
+
+
+class ResultCache:
+    def __init__(self, path=DEFAULT_PATH, max_entries=1000):
+        self.max_entries = max_entries
+        self.connection = sqlite3.connect(path)
+        self.connection.execute(
+            "CREATE TABLE IF NOT EXISTS results ("
+            " key TEXT, part TEXT, day TEXT, answer TEXT, seconds REAL, last_used REAL,"
+            " PRIMARY KEY (key, part))"
+        )
+
+    def close(self):
+        self.connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def get(self, key):
+        """ Returns a dict {part: (answer, seconds)}, empty if nothing is cached. """
+        with self.connection:
+            rows = self.connection.execute(
+                "SELECT part, answer, seconds FROM results WHERE key = ?", (key,)
+            ).fetchall()
+            self.connection.execute("UPDATE results SET last_used = ? WHERE key = ?", (time.time(), key))
+        return {part: (json.loads(answer), seconds) for part, answer, seconds in rows}
+
+    def put(self, key, day, results):
+        """ Stores all parts of a day at once, results is {part: (answer, seconds)}. """
+        # Answers of other types than int and str (e.g. SymPy numbers) are
+        # stored as strings.
+        now = time.time()
+        with self.connection:
+            self.connection.execute("DELETE FROM results WHERE key = ?", (key,))
+            self.connection.executemany(
+                "INSERT INTO results VALUES (?, ?, ?, ?, ?, ?)",
+                [
+                    (key, part, day, json.dumps(answer, default=str), seconds, now)
+                    for part, (answer, seconds) in results.items()
+                ],
+            )
+            self.connection.execute(
+                "DELETE FROM results WHERE key NOT IN"
+                " (SELECT key FROM results GROUP BY key ORDER BY MAX(last_used) DESC LIMIT ?)",
+                (self.max_entries,),
+            )
+
+    def clear(self):
+        with self.connection:
+            self.connection.execute("DELETE FROM results")
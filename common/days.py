@@ -0,0 +1,48 @@
+""" Advent of Code 2023, common helpers
+    Locating and loading the DayNN solution modules.
+"""
+
+import importlib.util
+import os
+import sys
+
+from common import loader
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DAYS = list(range(1, 26))
+
+
+def day_name(day):
+    return f"Day{day:02}"
+
+
+def day_dir(day):
+    return os.path.join(ROOT_DIR, day_name(day))
+
+
+def source_path(day):
+    return os.path.join(day_dir(day), f"{day_name(day)}.py")
+
+
+def input_path(day):
+    return os.path.join(day_dir(day), "input.txt")
+
+
+def load_day(day):
+    # Every DayNN module provides parse_input(lines), part1(data) and
+    # (except Day 25) part2(data).
+    spec = importlib.util.spec_from_file_location(day_name(day), source_path(day))
+    module = importlib.util.module_from_spec(spec)
+    # Registered like an imported module, so that its functions can be
+    # pickled for process pools.
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def read_lines(day):
+    path = input_path(day)
+    if not os.path.exists(path):
+        return []
+    with open(path, "rb") as f:
+        return loader.read_lines(f)
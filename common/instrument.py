@@ -0,0 +1,130 @@
+""" Advent of Code 2023, common helpers
+    Instrumentation of the solutions: counters, scoped spans (timers), debug
+    output and a tracer of the function calls within the spans.
+
+    Everything is disabled by default. Set the environment variable
+    AOC_INSTRUMENT=1 to enable it for a run of a DayNN script (the report is
+    printed to stderr at exit), or call enable(). When disabled, count() and
+    debug() return immediately and span() returns a shared null context, hot
+    loops should count in local variables and call count() once.
+"""
+
+import atexit
+import collections
+import contextlib
+import cProfile
+import os
+import sys
+import time
+
+enabled = False
+counters = collections.Counter()
+# Total time of every span, by name
+timers = collections.defaultdict(float)
+# Own time (without nested spans) of every stack of spans, e.g. "part1;search"
+stacks = collections.defaultdict(float)
+_stack = []
+_NULL_CONTEXT = contextlib.nullcontext()
+
+
+def enable(on=True):
+    global enabled
+    enabled = on
+
+
+def reset():
+    counters.clear()
+    timers.clear()
+    stacks.clear()
+    _stack.clear()
+
+
+def count(name, n=1):
+    if enabled:
+        counters[name] += n
+
+
+def debug(*args):
+    if enabled:
+        print(*args)
+
+
+def _close(entry, duration):
+    # entry has just been removed from the stack.
+    stacks[";".join([e[0] for e in _stack] + [entry[0]])] += duration - entry[1]
+    if len(_stack) > 0:
+        _stack[-1][1] += duration
+
+
+@contextlib.contextmanager
+def _span(name):
+    # Stack entries: [name, time of the nested spans and calls]
+    entry = [name, 0.0]
+    _stack.append(entry)
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        duration = time.perf_counter() - start
+        _stack.pop()
+        timers[name] += duration
+        _close(entry, duration)
+
+
+def span(name):
+    return _span(name) if enabled else _NULL_CONTEXT
+
+
+def report(file=sys.stderr):
+    for name, value in sorted(counters.items()):
+        print(f"{name:<30}{value:>16}", file=file)
+    for name, value in sorted(timers.items()):
+        print(f"{name:<30}{value:>16.6f} s", file=file)
+
+
+def _trace_event(frame, event, arg):
+    if event not in ("call", "return") or frame.f_code.co_filename in _UNTRACED_FILES:
+        return
+    if event == "call":
+        code = frame.f_code
+        _stack.append([f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})", 0.0, time.perf_counter()])
+    else:
+        entry = _stack.pop()
+        _close(entry, time.perf_counter() - entry[2])
+
+
+# The spans themselves are no calls on the stack.
+_UNTRACED_FILES = (__file__, contextlib.__file__)
+
+
+def trace(func, *args):
+    """ Calls func(*args) and records every Python function call like a span
+        (e.g. "Day17;part1;part1 (Day17.py:120);search (Day17.py:60)"), for
+        flame graphs. Very slow, and not together with profile().
+    """
+    sys.setprofile(_trace_event)
+    try:
+        return func(*args)
+    finally:
+        sys.setprofile(None)
+
+
+def write_folded(path):
+    # Collapsed stacks in microseconds, input for flamegraph.pl or speedscope.
+    with open(path, "w") as f:
+        for stack, seconds in sorted(stacks.items()):
+            f.write(f"{stack} {round(seconds * 1e6)}\n")
+
+
+def profile(path, func, *args):
+    """ Calls func(*args) with cProfile and writes the pstats file to path. """
+    profiler = cProfile.Profile()
+    try:
+        return profiler.runcall(func, *args)
+    finally:
+        profiler.dump_stats(path)
+
+
+if os.environ.get("AOC_INSTRUMENT", "0") not in ("", "0"):
+    enable()
+    atexit.register(report)
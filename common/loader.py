@@ -0,0 +1,160 @@
+""" Advent of Code 2023, common helpers
+    Input loading, separated from the solutions.
+
+    The parsers of the DayNN modules accept "lines" in any of these forms:
+    - a list or any other iterable of lines (str or bytes, with or without
+      line endings), e.g. a generator or an open file object,
+    - a bytes-like buffer (bytes, bytearray, memoryview) or a memory-mapped
+      file containing the whole input.
+"""
+
+import argparse
+import contextlib
+import mmap
+import os
+import sys
+
+
+def to_str(line):
+    if not isinstance(line, str):
+        line = bytes(line).decode()
+    return line.rstrip("\r\n")
+
+
+def iter_buffer(buffer):
+    # Only the single lines are copied, not the whole buffer.
+    if isinstance(buffer, memoryview):
+        # memoryview has no find()
+        buffer = buffer.tobytes()
+    start = 0
+    end_all = len(buffer)
+    while start < end_all:
+        end = buffer.find(b"\n", start)
+        if end == -1:
+            end = end_all
+        yield buffer[start:end].decode().rstrip("\r")
+        start = end + 1
+
+
+def iter_lines(lines):
+    if isinstance(lines, (bytes, bytearray, memoryview, mmap.mmap)):
+        yield from iter_buffer(lines)
+    elif isinstance(lines, str):
+        yield from lines.splitlines()
+    else:
+        for line in lines:
+            yield to_str(line)
+
+
+def read_lines(lines):
+    # Lists of strings without line endings (most common case) are returned
+    # as they are.
+    if isinstance(lines, list) and all(
+        map(lambda l: isinstance(l, str) and not l.endswith("\n"), lines)
+    ):
+        return lines
+    return list(iter_lines(lines))
+
+
+def read_buffer(lines):
+    # Whole input as one bytes-like buffer, e.g. for regular expressions
+    # running over all lines at once.
+    if isinstance(lines, (bytes, bytearray, memoryview, mmap.mmap)):
+        return lines
+    if isinstance(lines, str):
+        return lines.encode()
+    if hasattr(lines, "read"):
+        data = lines.read()
+        return data.encode() if isinstance(data, str) else data
+    return "\n".join(iter_lines(lines)).encode()
+
+
+def iter_chunks(lines, chunk_size=1 << 20):
+    """ Yields the input as bytes blocks of complete lines, each about
+        chunk_size bytes long. Only one block is held in memory at a time.
+    """
+    if isinstance(lines, (bytes, bytearray, memoryview, mmap.mmap)):
+        buffer = lines
+        position = 0
+
+        def read(size):
+            nonlocal position
+            block = buffer[position:position + size]
+            position += len(block)
+            return block
+
+    elif hasattr(lines, "read"):
+        read = lines.read
+    else:
+        lines = iter_lines(lines)
+
+        def read(size):
+            block = []
+            length = 0
+            for line in lines:
+                block.append(line + "\n")
+                length += len(block[-1])
+                if length >= size:
+                    break
+            return "".join(block)
+
+    rest = b""
+    while True:
+        block = read(chunk_size)
+        if len(block) == 0:
+            break
+        block = rest + (block.encode() if isinstance(block, str) else bytes(block))
+        # Lines split at the end of the block go into the next block.
+        end = block.rfind(b"\n") + 1
+        rest = block[end:]
+        if end > 0:
+            yield block[:end]
+    if len(rest) > 0:
+        yield rest
+
+
+def input_file_path(script_file):
+    return os.path.join(os.path.dirname(os.path.abspath(script_file)), "input.txt")
+
+
+def parse_args(flags=None, workers=False, argv=None):
+    """ Command-line arguments of a DayNN script: the optional input file (see
+        open_input), the flags given as {name: help} (e.g. "stream" for
+        --stream) and --workers N if workers is True. Unknown options are
+        errors. args.argv is the argument list for open_input.
+    """
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "input", nargs="?", help='input file, "-" for standard input (default: input.txt beside the script)'
+    )
+    for name, help_text in (flags or dict()).items():
+        parser.add_argument(f"--{name}", action="store_true", help=help_text)
+    if workers:
+        parser.add_argument("--workers", type=int, default=0, metavar="N", help="number of worker processes")
+    args = parser.parse_args(argv)
+    args.argv = [] if args.input is None else [args.input]
+    return args
+
+
+@contextlib.contextmanager
+def open_input(script_file, argv=None, mapped=True):
+    """ Opens the input of a DayNN script: by default the input.txt beside it,
+        the file given as first command-line argument, or standard input for
+        "-". Files are memory-mapped unless mapped is False, then the binary
+        file object is returned.
+    """
+    argv = sys.argv[1:] if argv is None else argv
+    path = argv[0] if len(argv) > 0 else input_file_path(script_file)
+    if path == "-":
+        yield sys.stdin.buffer
+        return
+    with open(path, "rb") as f:
+        if not mapped:
+            yield f
+            return
+        if os.fstat(f.fileno()).st_size == 0:
+            # Empty files cannot be memory-mapped.
+            yield b""
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+            yield m
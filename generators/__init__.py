@@ -0,0 +1,23 @@
+""" Advent of Code 2023, input generators
+    Synthetic puzzle inputs for every day in any size.
+
+    Every module dayNN provides generate(scale=1, seed=0) which returns the
+    input as text. scale=1 produces an input of about the size of the real
+    puzzle input, scale is a multiplier of the number of items (lines, cells,
+    nodes...). The same seed always produces the same input.
+
+    Inputs also satisfy the assumptions the solutions make about the real
+    puzzle inputs (e.g. hardcoded node names on Day 20 and Day 25).
+"""
+
+import importlib
+
+
+def generate(day, scale=1, seed=0):
+    module = importlib.import_module(f"generators.day{day:02}")
+    return module.generate(scale, seed)
+
+
+def generate_lines(day, scale=1, seed=0):
+    return generate(day, scale, seed).splitlines()
+
@@ -0,0 +1,22 @@
+""" Advent of Code 2023, input generators
+    Usage: python -m generators DAY [--scale SCALE] [--seed SEED] > input.txt
+"""
+
+import argparse
+import sys
+
+from generators import generate
+
+
+def main():
+    parser = argparse.ArgumentParser(prog="python -m generators", description="Generate a puzzle input.")
+    parser.add_argument("day", type=int)
+    parser.add_argument("--scale", type=float, default=1)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    sys.stdout.write(generate(args.day, args.scale, args.seed))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
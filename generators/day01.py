@@ -0,0 +1,29 @@
+""" Advent of Code 2023, input generators
+    Day 1: Trebuchet?!
+"""
+
+import random
+import string
+
+from generators.shapes import count
+
+DIGIT_WORDS = ["one", "two", "three", "four", "five", "six", "seven", "eight", "nine"]
+
+
+def generate(scale=1, seed=0):
+    rng = random.Random(seed)
+    lines = []
+    for _ in range(count(1000, scale)):
+        parts = []
+        for _ in range(rng.randint(1, 7)):
+            kind = rng.random()
+            if kind < 0.25:
+                parts.append(str(rng.randint(1, 9)))
+            elif kind < 0.55:
+                parts.append(rng.choice(DIGIT_WORDS))
+            else:
+                parts.append("".join(rng.choices(string.ascii_lowercase, k=rng.randint(1, 6))))
+        # Part 1 requires at least one digit in every line.
+        parts.insert(rng.randint(0, len(parts)), str(rng.randint(1, 9)))
+        lines.append("".join(parts))
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,19 @@
+""" Advent of Code 2023, input generators
+    Day 2: Cube Conundrum
+"""
+
+import random
+
+from generators.shapes import count
+
+
+def generate(scale=1, seed=0):
+    rng = random.Random(seed)
+    lines = []
+    for game in range(1, count(100, scale) + 1):
+        draws = []
+        for _ in range(rng.randint(1, 6)):
+            colors = rng.sample(["red", "green", "blue"], rng.randint(1, 3))
+            draws.append(", ".join([f"{rng.randint(1, 20)} {color}" for color in colors]))
+        lines.append(f"Game {game}: " + "; ".join(draws))
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,28 @@
+""" Advent of Code 2023, input generators
+    Day 3: Gear Ratios
+"""
+
+import random
+
+from generators.shapes import grid_side
+
+SYMBOLS = "*#+$/=%@&-"
+
+
+def generate(scale=1, seed=0):
+    rng = random.Random(seed)
+    side = grid_side(140, scale)
+    lines = []
+    for _ in range(side):
+        row = []
+        while len(row) < side:
+            if rng.random() < 0.12 and side - len(row) >= 4:
+                row.extend(str(rng.randint(1, 999)))
+                # Numbers are separated by at least one non-digit.
+                row.append(rng.choice(SYMBOLS) if rng.random() < 0.08 else ".")
+            elif rng.random() < 0.06:
+                row.append("*" if rng.random() < 0.4 else rng.choice(SYMBOLS))
+            else:
+                row.append(".")
+        lines.append("".join(row[:side]))
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,28 @@
+""" Advent of Code 2023, input generators
+    Day 4: Scratchcards
+"""
+
+import random
+
+from generators.shapes import count
+
+
+def generate(scale=1, seed=0):
+    rng = random.Random(seed)
+    card_count = count(200, scale)
+    width = len(str(card_count))
+    lines = []
+    for card in range(1, card_count + 1):
+        winning = rng.sample(range(1, 100), 10)
+        # Cards never make you copy a card past the end of the table.
+        matches = min(rng.choice([0, 0, 0, 1, 2, 3, 4, 5, 6, 8, 10]), card_count - card)
+        others = [n for n in range(1, 100) if n not in winning]
+        own = rng.sample(winning, matches) + rng.sample(others, 25 - matches)
+        rng.shuffle(own)
+        lines.append(
+            f"Card {card:>{width}}: "
+            + " ".join([f"{n:>2}" for n in winning])
+            + " | "
+            + " ".join([f"{n:>2}" for n in own])
+        )
+    return "\n".join(lines) + "\n"
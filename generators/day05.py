@@ -0,0 +1,55 @@
+""" Advent of Code 2023, input generators
+    Day 5: If You Give A Seed A Fertilizer
+"""
+
+import random
+
+from generators.shapes import count
+
+MAP_NAMES = [
+    "seed-to-soil",
+    "soil-to-fertilizer",
+    "fertilizer-to-water",
+    "water-to-light",
+    "light-to-temperature",
+    "temperature-to-humidity",
+    "humidity-to-location",
+]
+
+
+def generate(scale=1, seed=0):
+    rng = random.Random(seed)
+    end_exclusive = rng.randint(2**31, 2**32)
+    conversion_count = count(30, scale)
+
+    seeds = []
+    for _ in range(count(10, scale)):
+        start = rng.randrange(end_exclusive - 2)
+        length = rng.randint(1, min(end_exclusive - 1 - start, end_exclusive // 10))
+        seeds.extend([start, length])
+    lines = ["seeds: " + " ".join(map(str, seeds)), ""]
+
+    for name in MAP_NAMES:
+        # Every map is a permutation of intervals of [0, end_exclusive).
+        cuts = sorted(rng.sample(range(1, end_exclusive), conversion_count - 1))
+        bounds = [0] + cuts + [end_exclusive]
+        intervals = [(bounds[i], bounds[i + 1] - bounds[i]) for i in range(len(bounds) - 1)]
+        order = list(range(len(intervals)))
+        rng.shuffle(order)
+        dest = dict()
+        current = 0
+        for i in order:
+            dest[i] = current
+            current += intervals[i][1]
+        lines.append(f"{name} map:")
+        entries = []
+        for i, (src, length) in enumerate(intervals):
+            # Leave out some conversions (identity mapping). The first one is
+            # always kept.
+            if i > 0 and rng.random() < 0.1:
+                continue
+            entries.append(f"{dest[i]} {src} {length}")
+        rng.shuffle(entries)
+        lines.extend(entries)
+        lines.append("")
+    return "\n".join(lines)
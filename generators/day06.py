@@ -0,0 +1,24 @@
+""" Advent of Code 2023, input generators
+    Day 6: Wait For It
+"""
+
+import random
+
+from generators.shapes import count
+
+
+def generate(scale=1, seed=0):
+    rng = random.Random(seed)
+    times = []
+    distances = []
+    for _ in range(count(4, scale)):
+        time_ = rng.randint(40, 99)
+        best = (time_ // 2) * (time_ - time_ // 2)
+        # Every record can be beaten.
+        times.append(time_)
+        distances.append(rng.randint(best // 2, best - 1))
+    width = max([len(str(d)) for d in distances]) + 1
+    return (
+        "Time:    " + "".join([f"{t:>{width}}" for t in times]) + "\n"
+        "Distance:" + "".join([f"{d:>{width}}" for d in distances]) + "\n"
+    )
@@ -0,0 +1,16 @@
+""" Advent of Code 2023, input generators
+    Day 7: Camel Cards
+"""
+
+import random
+
+from generators.shapes import count
+
+
+def generate(scale=1, seed=0):
+    rng = random.Random(seed)
+    lines = []
+    for _ in range(count(1000, scale)):
+        cards = "".join(rng.choices("23456789TJQKA", k=5))
+        lines.append(f"{cards} {rng.randint(1, 1000)}")
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,57 @@
+""" Advent of Code 2023, input generators
+    Day 8: Haunted Wasteland
+"""
+
+import math
+import random
+
+from generators.shapes import is_prime
+
+LETTERS = "BCDEFGHIJKLMNOPQRSTUVWXY"  # Neither A nor Z
+
+
+def node_name(n):
+    # Third letter is never Z and last letter never A.
+    name = ""
+    while len(name) < 3 or n > 0:
+        name += LETTERS[n % len(LETTERS)]
+        n //= len(LETTERS)
+    return name
+
+
+def generate(scale=1, seed=0):
+    """ Like the real input, every ghost enters a cycle whose length is a
+        multiple of the instruction count and hits its only Z node exactly at
+        the end of the cycle. Ghost "AAA" ends at "ZZZ".
+    """
+    rng = random.Random(seed)
+    size = max(3, round(11 * math.sqrt(scale)))
+    instructions = "".join(rng.choices("LR", k=size))
+    primes = [n for n in range(size, 100 * size) if is_prime(n)][:6]
+
+    graph = dict()
+    name_index = 0
+    for ghost, prime in enumerate(primes):
+        start = "AAA" if ghost == 0 else LETTERS[ghost] * 2 + "A"
+        end = "ZZZ" if ghost == 0 else LETTERS[ghost] * 2 + "Z"
+        cycle = []
+        for _ in range(prime * len(instructions) - 1):
+            cycle.append(node_name(name_index))
+            name_index += 1
+        cycle.append(end)
+        graph[start] = (cycle[0], cycle[0])
+        for k, node in enumerate(cycle):
+            # Node k of the cycle is always reached after k + 1 steps.
+            next_node = cycle[(k + 1) % len(cycle)]
+            other = rng.choice(cycle)
+            if instructions[(k + 1) % len(instructions)] == "L":
+                graph[node] = (next_node, other)
+            else:
+                graph[node] = (other, next_node)
+
+    nodes = list(graph.keys())
+    rng.shuffle(nodes)
+    lines = [instructions, ""]
+    for node in nodes:
+        lines.append(f"{node} = ({graph[node][0]}, {graph[node][1]})")
+    return "\n".join(lines) + "\n"
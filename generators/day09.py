@@ -0,0 +1,24 @@
+""" Advent of Code 2023, input generators
+    Day 9: Mirage Maintenance
+"""
+
+import random
+
+from generators.shapes import count
+
+
+def generate(scale=1, seed=0):
+    rng = random.Random(seed)
+    lines = []
+    for _ in range(count(200, scale)):
+        # Integrate a constant sequence a random number of times.
+        values = [rng.randint(-10, 10)] * 21
+        for _ in range(rng.randint(1, 8)):
+            current = rng.randint(-20, 20)
+            integrated = [current]
+            for v in values[:-1]:
+                current += v
+                integrated.append(current)
+            values = integrated
+        lines.append(" ".join(map(str, values)))
+    return "\n".join(lines) + "\n"
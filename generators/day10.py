@@ -0,0 +1,46 @@
+""" Advent of Code 2023, input generators
+    Day 10: Pipe Maze
+"""
+
+import random
+
+from generators.shapes import grid_side, tree_loop
+
+PIPES = {
+    frozenset([(-1, 0), (1, 0)]): "|",
+    frozenset([(0, -1), (0, 1)]): "-",
+    frozenset([(-1, 0), (0, 1)]): "L",
+    frozenset([(-1, 0), (0, -1)]): "J",
+    frozenset([(1, 0), (0, -1)]): "7",
+    frozenset([(1, 0), (0, 1)]): "F",
+}
+
+
+def generate(scale=1, seed=0):
+    rng = random.Random(seed)
+    quarter = grid_side(35, scale)
+    side = 4 * quarter
+    # Loop around a random tree, all other tiles are junk. The loop is
+    # stretched by 2 so that it encloses some tiles.
+    loop = []
+    tree = tree_loop(rng, quarter, quarter, 0.6)
+    for k, cell in enumerate(tree):
+        next_ = tree[(k + 1) % len(tree)]
+        loop.append((2 * cell[0], 2 * cell[1]))
+        loop.append((cell[0] + next_[0], cell[1] + next_[1]))
+    grid = [rng.choices("|-LJ7F.", k=side) for _ in range(side)]
+    for k, cell in enumerate(loop):
+        prev, next_ = loop[k - 1], loop[(k + 1) % len(loop)]
+        directions = frozenset([(p[0] - cell[0], p[1] - cell[1]) for p in (prev, next_)])
+        grid[cell[0]][cell[1]] = PIPES[directions]
+
+    # The solution only supports a corner pipe under the start position.
+    start = rng.choice([cell for cell in loop if grid[cell[0]][cell[1]] in "LJ7F"])
+    loop_cells = set(loop)
+    grid[start[0]][start[1]] = "S"
+    # Junk next to the start position must not connect to it.
+    for dr, dc in ((0, 1), (1, 0), (0, -1), (-1, 0)):
+        row, col = start[0] + dr, start[1] + dc
+        if 0 <= row < side and 0 <= col < side and (row, col) not in loop_cells:
+            grid[row][col] = "."
+    return "\n".join(["".join(row) for row in grid]) + "\n"
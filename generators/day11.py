@@ -0,0 +1,25 @@
+""" Advent of Code 2023, input generators
+    Day 11: Cosmic Expansion
+"""
+
+import random
+
+from generators.shapes import grid_side
+
+
+def generate(scale=1, seed=0):
+    rng = random.Random(seed)
+    # The solution expects a square image.
+    side = grid_side(140, scale)
+    empty_rows = set(rng.sample(range(side), max(1, side // 20)))
+    empty_columns = set(rng.sample(range(side), max(1, side // 20)))
+    lines = []
+    for row in range(side):
+        line = []
+        for col in range(side):
+            if row in empty_rows or col in empty_columns:
+                line.append(".")
+            else:
+                line.append("#" if rng.random() < 0.025 else ".")
+        lines.append("".join(line))
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,22 @@
+""" Advent of Code 2023, input generators
+    Day 12: Hot Springs
+"""
+
+import random
+
+from generators.shapes import count
+
+
+def generate(scale=1, seed=0):
+    rng = random.Random(seed)
+    lines = []
+    for _ in range(count(1000, scale)):
+        # At least two groups, the parser reads the groups as a tuple.
+        damages = [rng.randint(1, 5) for _ in range(rng.randint(2, 5))]
+        springs = "." * rng.randint(0, 3)
+        for i, damage in enumerate(damages):
+            springs += "#" * damage
+            springs += "." * (rng.randint(1, 3) if i + 1 < len(damages) else rng.randint(0, 3))
+        pattern = "".join(["?" if rng.random() < 0.45 else c for c in springs])
+        lines.append(f"{pattern} {','.join(map(str, damages))}")
+    return "\n".join(lines) + "\n"
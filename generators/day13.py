@@ -0,0 +1,60 @@
+""" Advent of Code 2023, input generators
+    Day 13: Point of Incidence
+"""
+
+import random
+
+from generators.shapes import count
+
+
+def mirror_differences(rows, line):
+    # Number of differing tiles when mirroring at the line above rows[line]
+    span = min(line, len(rows) - line)
+    differences = 0
+    for k in range(span):
+        a, b = rows[line - 1 - k], rows[line + k]
+        differences += sum([1 for i in range(len(a)) if a[i] != b[i]])
+    return differences
+
+
+def mirror_lines(rows, differences):
+    return [line for line in range(1, len(rows)) if mirror_differences(rows, line) == differences]
+
+
+def transpose(rows):
+    return ["".join(column) for column in zip(*rows)]
+
+
+def make_pattern(rng):
+    """ Pattern with exactly one line of reflection, and exactly one other line
+        of reflection after fixing a single smudge.
+    """
+    while True:
+        height, width = rng.randint(5, 17), rng.randint(5, 17)
+        smudge_line = rng.randint(1, height - 1)
+        rows = [[rng.choice("#.") for _ in range(width)] for _ in range(height)]
+        # The vertical line between column 0 and 1 is the line of reflection.
+        for row in rows:
+            row[1] = row[0]
+        # After fixing the smudge, the pattern mirrors at the smudge line.
+        span = min(smudge_line, height - smudge_line)
+        for k in range(span):
+            rows[smudge_line + k] = rows[smudge_line - 1 - k].copy()
+        smudge_row = rng.randint(smudge_line - span, smudge_line + span - 1)
+        smudge_col = rng.randint(2, width - 1)
+        rows[smudge_row][smudge_col] = "#" if rows[smudge_row][smudge_col] == "." else "."
+
+        rows = ["".join(row) for row in rows]
+        if rng.random() < 0.5:
+            rows = transpose(rows)
+        columns = transpose(rows)
+        perfect = mirror_lines(rows, 0) + mirror_lines(columns, 0)
+        smudged = mirror_lines(rows, 1) + mirror_lines(columns, 1)
+        if len(perfect) == 1 and len(smudged) == 1:
+            return rows
+
+
+def generate(scale=1, seed=0):
+    rng = random.Random(seed)
+    patterns = ["\n".join(make_pattern(rng)) for _ in range(count(100, scale))]
+    return "\n\n".join(patterns) + "\n"
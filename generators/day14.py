@@ -0,0 +1,14 @@
+""" Advent of Code 2023, input generators
+    Day 14: Parabolic Reflector Dish
+"""
+
+import random
+
+from generators.shapes import grid_side
+
+
+def generate(scale=1, seed=0):
+    rng = random.Random(seed)
+    side = grid_side(100, scale)
+    lines = ["".join(rng.choices("O#.", weights=[20, 15, 65], k=side)) for _ in range(side)]
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,21 @@
+""" Advent of Code 2023, input generators
+    Day 15: Lens Library
+"""
+
+import random
+import string
+
+from generators.shapes import count
+
+
+def generate(scale=1, seed=0):
+    rng = random.Random(seed)
+    labels = set()
+    while len(labels) < count(600, scale):
+        labels.add("".join(rng.choices(string.ascii_lowercase, k=rng.randint(2, 6))))
+    labels = sorted(labels)
+    steps = []
+    for _ in range(count(4000, scale)):
+        label = rng.choice(labels)
+        steps.append(f"{label}-" if rng.random() < 0.3 else f"{label}={rng.randint(1, 9)}")
+    return ",".join(steps) + "\n"
@@ -0,0 +1,14 @@
+""" Advent of Code 2023, input generators
+    Day 16: The Floor Will Be Lava
+"""
+
+import random
+
+from generators.shapes import grid_side
+
+
+def generate(scale=1, seed=0):
+    rng = random.Random(seed)
+    side = grid_side(110, scale)
+    lines = ["".join(rng.choices(".|-/\\", weights=[90, 3, 3, 2, 2], k=side)) for _ in range(side)]
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,14 @@
+""" Advent of Code 2023, input generators
+    Day 17: Clumsy Crucible
+"""
+
+import random
+
+from generators.shapes import grid_side
+
+
+def generate(scale=1, seed=0):
+    rng = random.Random(seed)
+    side = grid_side(141, scale)
+    lines = ["".join(rng.choices("123456789", k=side)) for _ in range(side)]
+    return "\n".join(lines) + "\n"
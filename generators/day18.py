@@ -0,0 +1,50 @@
+""" Advent of Code 2023, input generators
+    Day 18: Lavaduct Lagoon
+"""
+
+import random
+
+from generators.shapes import grid_side, loop_corners, tree_loop
+
+DIRECTIONS = {(0, 1): "R", (1, 0): "D", (0, -1): "L", (-1, 0): "U"}
+DIRECTION_DIGITS = {"R": 0, "D": 1, "L": 2, "U": 3}
+
+
+def stretch(rng, values, min_gap, max_gap):
+    # Monotone mapping of the grid lines keeps the loop simple.
+    mapping = dict()
+    current = 0
+    for v in sorted(set(values)):
+        current += rng.randint(min_gap, max_gap)
+        mapping[v] = current
+    return mapping
+
+
+def generate(scale=1, seed=0):
+    """ Both dig plans (part 1 and part 2) describe the same random simple
+        loop, stretched differently. Every instruction is a turn.
+    """
+    rng = random.Random(seed)
+    half = grid_side(16, scale)
+    corners = loop_corners(tree_loop(rng, half, half, 0.6))
+    rows = [c[0] for c in corners]
+    cols = [c[1] for c in corners]
+    # A gap of at least 2 keeps parallel trenches from touching in part 1.
+    rows1, cols1 = stretch(rng, rows, 2, 10), stretch(rng, cols, 2, 10)
+    # Lengths of part 2 have to fit into five hex digits.
+    max_gap2 = 0xFFFFF // (2 * half)
+    rows2, cols2 = stretch(rng, rows, 1, max_gap2), stretch(rng, cols, 1, max_gap2)
+
+    lines = []
+    for k, corner in enumerate(corners):
+        next_ = corners[(k + 1) % len(corners)]
+        step = ((next_[0] > corner[0]) - (next_[0] < corner[0]), (next_[1] > corner[1]) - (next_[1] < corner[1]))
+        direction = DIRECTIONS[step]
+        if step[0] != 0:
+            length1 = abs(rows1[next_[0]] - rows1[corner[0]])
+            length2 = abs(rows2[next_[0]] - rows2[corner[0]])
+        else:
+            length1 = abs(cols1[next_[1]] - cols1[corner[1]])
+            length2 = abs(cols2[next_[1]] - cols2[corner[1]])
+        lines.append(f"{direction} {length1} (#{length2:05x}{DIRECTION_DIGITS[direction]})")
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,46 @@
+""" Advent of Code 2023, input generators
+    Day 19: Aplenty
+"""
+
+import itertools
+import random
+import string
+
+from generators.shapes import count
+
+
+def workflow_names(rng):
+    names = ["".join(p) for length in (2, 3) for p in itertools.product(string.ascii_lowercase, repeat=length)]
+    names.remove("in")
+    rng.shuffle(names)
+    return iter(names)
+
+
+def generate(scale=1, seed=0):
+    rng = random.Random(seed)
+    names = workflow_names(rng)
+    budget = count(550, scale) - 1
+    # Workflows form a tree below "in", so every part gets accepted or rejected.
+    pending = ["in"]
+    lines = []
+    while len(pending) > 0:
+        name = pending.pop(0)
+        rules = []
+        for _ in range(rng.randint(1, 3) + 1):
+            if budget > 0 and rng.random() < 0.6:
+                target = next(names)
+                pending.append(target)
+                budget -= 1
+            else:
+                target = rng.choice("AR")
+            rules.append(target)
+        conditions = [
+            f"{rng.choice('xmas')}{rng.choice('<>')}{rng.randint(2, 3999)}:{target}" for target in rules[:-1]
+        ]
+        lines.append(f"{name}{{{','.join(conditions + [rules[-1]])}}}")
+    rng.shuffle(lines)
+    lines.append("")
+    for _ in range(count(200, scale)):
+        x, m, a, s = [rng.randint(1, 4000) for _ in range(4)]
+        lines.append(f"{{x={x},m={m},a={a},s={s}}}")
+    return "\n".join(lines) + "\n"
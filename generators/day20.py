@@ -0,0 +1,59 @@
+""" Advent of Code 2023, input generators
+    Day 20: Pulse Propagation
+"""
+
+import itertools
+import math
+import random
+import string
+
+from generators.shapes import is_prime
+
+# Names hardcoded in the solution
+INVERTERS = ["st", "tn", "hh", "dt"]
+
+
+def generate(scale=1, seed=0):
+    """ Like the real input: four binary counters of flip-flops, each with a
+        conjunction which fires and resets the counter at a prime number of
+        button presses. The conjunctions feed rx via inverters and a final
+        conjunction. scale multiplies the length of the counter cycles.
+    """
+    rng = random.Random(seed)
+    bits = 12 + max(0, round(math.log2(scale)))
+    names = ["".join(p) for p in itertools.product(string.ascii_lowercase, repeat=2)]
+    names = [n for n in names if n not in INVERTERS + ["rx"]]
+    rng.shuffle(names)
+    names = iter(names)
+    primes = set()
+    while len(primes) < 4:
+        n = rng.randrange(2 ** (bits - 1) + 1, 2**bits, 2)
+        if is_prime(n):
+            primes.add(n)
+    primes = sorted(primes)
+
+    final = next(names)
+    modules = {final: ("&", ["rx"])}
+    broadcaster = []
+    for prime, inverter in zip(primes, INVERTERS):
+        flip_flops = [next(names) for _ in range(bits)]
+        counter = next(names)
+        counter_outputs = [flip_flops[0]]
+        for i, flip_flop in enumerate(flip_flops):
+            outputs = [] if i + 1 == bits else [flip_flops[i + 1]]
+            if prime & (1 << i):
+                outputs.append(counter)
+            elif i > 0:
+                counter_outputs.append(flip_flop)
+            rng.shuffle(outputs)
+            modules[flip_flop] = ("%", outputs)
+        rng.shuffle(counter_outputs)
+        modules[counter] = ("&", counter_outputs + [inverter])
+        modules[inverter] = ("&", [final])
+        broadcaster.append(flip_flops[0])
+
+    lines = ["broadcaster -> " + ", ".join(broadcaster)]
+    for name, (type_, outputs) in modules.items():
+        lines.append(f"{type_}{name} -> {', '.join(outputs)}")
+    rng.shuffle(lines)
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,54 @@
+""" Advent of Code 2023, input generators
+    Day 21: Step Counter
+"""
+
+import math
+import random
+
+from generators.shapes import grid_side
+
+STEPS = 26501365
+
+
+def valid_sides():
+    # The solution requires 26501365 steps to end exactly on a map boundary:
+    # (STEPS - side // 2) % side == 0, i.e. side divides 2 * STEPS + 1.
+    # Only 131 and 393 are small enough, the next one is 134867.
+    n = 2 * STEPS + 1
+    return [d for d in range(5, math.isqrt(n) + 1) if n % d == 0 and d % 2 == 1]
+
+
+def generate(scale=1, seed=0):
+    """ Square map with the start position in the center. The center row and
+        column and the border are free of rocks like in the real input.
+        The side length is the valid one closest to the scaled side.
+    """
+    rng = random.Random(seed)
+    target = grid_side(131, scale)
+    side = min(valid_sides(), key=lambda d: abs(d - target))
+    center = side // 2
+    free = {0, center, side - 1}
+    grid = [["." for _ in range(side)] for _ in range(side)]
+    for row in range(side):
+        for col in range(side):
+            if row not in free and col not in free and rng.random() < 0.12:
+                grid[row][col] = "#"
+
+    # Plots which cannot be reached at all would distort the counts.
+    reached = {(center, center)}
+    stack = [(center, center)]
+    while len(stack) > 0:
+        row, col = stack.pop()
+        for dr, dc in ((0, 1), (1, 0), (0, -1), (-1, 0)):
+            pos = (row + dr, col + dc)
+            if 0 <= pos[0] < side and 0 <= pos[1] < side and pos not in reached:
+                if grid[pos[0]][pos[1]] == ".":
+                    reached.add(pos)
+                    stack.append(pos)
+    for row in range(side):
+        for col in range(side):
+            if (row, col) not in reached:
+                grid[row][col] = "#"
+
+    grid[center][center] = "S"
+    return "\n".join(["".join(row) for row in grid]) + "\n"
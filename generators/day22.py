@@ -0,0 +1,34 @@
+""" Advent of Code 2023, input generators
+    Day 22: Sand Slabs
+"""
+
+import random
+
+from generators.shapes import count
+
+
+def generate(scale=1, seed=0):
+    rng = random.Random(seed)
+    brick_count = count(1200, scale)
+    max_height = brick_count // 3 + 10
+    occupied = set()
+    lines = []
+    while len(lines) < brick_count:
+        axis = rng.choice([0, 0, 1, 1, 2])
+        length = rng.randint(1, 4)
+        start = [rng.randint(0, 9), rng.randint(0, 9), rng.randint(1, max_height)]
+        end = start.copy()
+        end[axis] += length - 1
+        if end[0] > 9 or end[1] > 9:
+            continue
+        cubes = [(start[0], start[1], start[2])]
+        for i in range(1, length):
+            cube = start.copy()
+            cube[axis] += i
+            cubes.append(tuple(cube))
+        # Bricks of the snapshot never overlap.
+        if any(map(lambda c: c in occupied, cubes)):
+            continue
+        occupied.update(cubes)
+        lines.append(f"{start[0]},{start[1]},{start[2]}~{end[0]},{end[1]},{end[2]}")
+    return "\n".join(lines) + "\n"
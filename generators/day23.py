@@ -0,0 +1,69 @@
+""" Advent of Code 2023, input generators
+    Day 23: A Long Walk
+"""
+
+import math
+import random
+
+SPACING = 28
+MARGIN = 3
+
+
+def generate(scale=1, seed=0):
+    """ Square grid of junctions connected by winding trails. Slopes next to
+        every junction only allow walking east or south, like in the real
+        input the slopes turn the trails into a directed acyclic graph.
+    """
+    rng = random.Random(seed)
+    junctions = max(2, round(6 * math.sqrt(scale)))
+    side = 2 * MARGIN + 1 + (junctions - 1) * SPACING
+    grid = [["#" for _ in range(side)] for _ in range(side)]
+
+    def junction_pos(a, b):
+        return MARGIN + a * SPACING, MARGIN + b * SPACING
+
+    def dig(path, slope):
+        # path: cells from one junction to the next one (both excluded)
+        for cell in path:
+            grid[cell[0]][cell[1]] = "."
+        for cell in (path[0], path[-1]):
+            grid[cell[0]][cell[1]] = slope
+
+    for a in range(junctions):
+        for b in range(junctions):
+            row, col = junction_pos(a, b)
+            grid[row][col] = "."
+            if b + 1 < junctions:
+                # Trail east with a detour to the south in the right half.
+                cols = list(range(col + 1, col + SPACING))
+                c1 = rng.randint(col + SPACING // 2, col + SPACING - 8)
+                c2 = rng.randint(c1 + 2, col + SPACING - 4)
+                # No detours outside of the map along the last row.
+                depth = rng.randint(1, SPACING // 2 - 3) if a + 1 < junctions else 0
+                path = [(row, c) for c in cols if c <= c1]
+                path += [(row + d, c1) for d in range(1, depth + 1)]
+                path += [(row + depth, c) for c in range(c1 + 1, c2)]
+                path += [(row + d, c2) for d in range(depth, -1, -1)]
+                path += [(row, c) for c in cols if c > c2]
+                dig(path, ">")
+            if a + 1 < junctions:
+                # Trail south with a detour to the east in the lower half.
+                rows = list(range(row + 1, row + SPACING))
+                r1 = rng.randint(row + SPACING // 2, row + SPACING - 8)
+                r2 = rng.randint(r1 + 2, row + SPACING - 4)
+                depth = rng.randint(1, SPACING // 2 - 3) if b + 1 < junctions else 0
+                path = [(r, col) for r in rows if r <= r1]
+                path += [(r1, col + d) for d in range(1, depth + 1)]
+                path += [(r, col + depth) for r in range(r1 + 1, r2)]
+                path += [(r2, col + d) for d in range(depth, -1, -1)]
+                path += [(r, col) for r in rows if r > r2]
+                dig(path, "v")
+
+    # Trails from the start to the first junction and from the last junction
+    # to the end. Like all others they have slopes next to the junctions.
+    dig([(0, 1), (1, 1), (2, 1), (3, 1), (3, 2)], ">")
+    grid[0][1] = "."
+    end = side - 1 - MARGIN
+    dig([(end + 1, end), (end + 2, end), (end + 2, end + 1), (end + 2, end + 2), (end + 3, end + 2)], "v")
+    grid[side - 1][side - 2] = "."
+    return "\n".join(["".join(row) for row in grid]) + "\n"
@@ -0,0 +1,29 @@
+""" Advent of Code 2023, input generators
+    Day 24: Never Tell Me The Odds
+"""
+
+import random
+
+from generators.shapes import count
+
+
+def generate(scale=1, seed=0):
+    """ Hailstones which are all hit by one rock with integer position and
+        velocity at distinct integer times, as required for part 2.
+    """
+    rng = random.Random(seed)
+    hailstone_count = count(300, scale)
+    rock_pos = [rng.randint(250_000_000_000_000, 350_000_000_000_000) for _ in range(3)]
+    rock_vel = [rng.randint(-300, 300) for _ in range(3)]
+    times = set()
+    lines = []
+    while len(lines) < hailstone_count:
+        t = rng.randint(50_000_000_000, 1_000_000_000_000)
+        if t in times:
+            continue
+        times.add(t)
+        vel = [v + rng.randint(-200, 200) for v in rock_vel]
+        # Hailstone and rock are at the same place at time t.
+        pos = [p + (rv - v) * t for p, rv, v in zip(rock_pos, rock_vel, vel)]
+        lines.append(f"{pos[0]}, {pos[1]}, {pos[2]} @ {vel[0]}, {vel[1]}, {vel[2]}")
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,52 @@
+""" Advent of Code 2023, input generators
+    Day 25: Snowverload
+"""
+
+import itertools
+import random
+import string
+
+from generators.shapes import count
+
+# Names hardcoded in the solution: the three edges to cut and one node of
+# each group.
+GROUP1 = ["txf", "jjn", "lms", "gdd"]
+GROUP2 = ["xnn", "nhg", "tmc", "qgn"]
+
+
+def connected_group(rng, nodes):
+    # Ring with random chords, every node has at least four neighbours, so
+    # that no three edges within a group disconnect it.
+    edges = set()
+    for i, node in enumerate(nodes):
+        for offset in (1, 2):
+            edges.add((node, nodes[(i + offset) % len(nodes)]))
+    for _ in range(len(nodes) // 2):
+        a, b = rng.sample(nodes, 2)
+        if (b, a) not in edges:
+            edges.add((a, b))
+    return edges
+
+
+def generate(scale=1, seed=0):
+    rng = random.Random(seed)
+    node_count = count(1500, scale)
+    names = ["".join(p) for p in itertools.product(string.ascii_lowercase, repeat=3)]
+    names = [n for n in names if n not in GROUP1 + GROUP2]
+    names = rng.sample(names, node_count - len(GROUP1) - len(GROUP2))
+    split = rng.randint(node_count * 2 // 5, node_count * 3 // 5) - len(GROUP1)
+    group1 = GROUP1 + names[:split]
+    group2 = GROUP2 + names[split:]
+    rng.shuffle(group1)
+    rng.shuffle(group2)
+
+    edges = connected_group(rng, group1) | connected_group(rng, group2)
+    edges |= set(zip(GROUP1[:3], GROUP2[:3]))
+    connections = dict()
+    for a, b in edges:
+        if rng.random() < 0.5:
+            a, b = b, a
+        connections.setdefault(a, []).append(b)
+    lines = [f"{a}: {' '.join(ends)}" for a, ends in connections.items()]
+    rng.shuffle(lines)
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,108 @@
+""" Advent of Code 2023, input generators
+    Helpers shared by the generators.
+"""
+
+import math
+
+
+def count(base, scale):
+    return max(1, round(base * scale))
+
+
+def grid_side(base, scale):
+    # scale multiplies the number of cells, not the side length.
+    return max(3, round(base * math.sqrt(scale)))
+
+
+def random_tree(rng, rows, cols, coverage):
+    """ Random spanning tree (randomized Prim) on a part of a rows x cols grid.
+        Returns the set of cells and the set of edges (pairs of cells).
+    """
+    start = (rng.randrange(rows), rng.randrange(cols))
+    cells = {start}
+    edges = set()
+    frontier = [(start, n) for n in grid_neighbors(start, rows, cols)]
+    target = max(1, round(rows * cols * coverage))
+    while len(frontier) > 0 and len(cells) < target:
+        index = rng.randrange(len(frontier))
+        frontier[index], frontier[-1] = frontier[-1], frontier[index]
+        cell, neighbor = frontier.pop()
+        if neighbor in cells:
+            continue
+        cells.add(neighbor)
+        edges.add((cell, neighbor))
+        edges.add((neighbor, cell))
+        frontier.extend([(neighbor, n) for n in grid_neighbors(neighbor, rows, cols) if n not in cells])
+    return cells, edges
+
+
+def grid_neighbors(cell, rows, cols):
+    row, col = cell
+    result = []
+    for dr, dc in ((0, 1), (1, 0), (0, -1), (-1, 0)):
+        if 0 <= row + dr < rows and 0 <= col + dc < cols:
+            result.append((row + dr, col + dc))
+    return result
+
+
+def tree_loop(rng, rows, cols, coverage):
+    """ Simple closed loop on a (2 * rows) x (2 * cols) grid, which runs around
+        a random spanning tree on the rows x cols grid. Returns the cells of
+        the loop in order.
+    """
+    cells, edges = random_tree(rng, rows, cols, coverage)
+    links = dict()
+
+    def link(a, b):
+        links.setdefault(a, []).append(b)
+        links.setdefault(b, []).append(a)
+
+    for i, j in cells:
+        tl, tr, bl, br = (2 * i, 2 * j), (2 * i, 2 * j + 1), (2 * i + 1, 2 * j), (2 * i + 1, 2 * j + 1)
+        if ((i, j), (i - 1, j)) not in edges:
+            link(tl, tr)
+        if ((i, j), (i + 1, j)) not in edges:
+            link(bl, br)
+        else:
+            link(bl, (2 * i + 2, 2 * j))
+            link(br, (2 * i + 2, 2 * j + 1))
+        if ((i, j), (i, j - 1)) not in edges:
+            link(tl, bl)
+        if ((i, j), (i, j + 1)) not in edges:
+            link(tr, br)
+        else:
+            link(tr, (2 * i, 2 * j + 2))
+            link(br, (2 * i + 1, 2 * j + 2))
+
+    start = next(iter(links))
+    loop = [start]
+    previous, current = None, start
+    while True:
+        a, b = links[current]
+        next_ = a if a != previous else b
+        if next_ == start:
+            break
+        loop.append(next_)
+        previous, current = current, next_
+    assert len(loop) == len(links)
+    return loop
+
+
+def loop_corners(loop):
+    # Cells of the loop where its direction changes, starting with a corner.
+    corners = []
+    n = len(loop)
+    for k in range(n):
+        prev, cell, next_ = loop[k - 1], loop[k], loop[(k + 1) % n]
+        if (cell[0] - prev[0], cell[1] - prev[1]) != (next_[0] - cell[0], next_[1] - cell[1]):
+            corners.append(cell)
+    return corners
+
+
+def is_prime(n):
+    if n < 2:
+        return False
+    for i in range(2, math.isqrt(n) + 1):
+        if n % i == 0:
+            return False
+    return True
@@ -0,0 +1,173 @@
+""" Advent of Code 2023, run all days
+    Solves the DayNN puzzles concurrently on a process pool and prints one
+    table with the answers and timings of all days.
+
+    Usage examples:
+      python run_all.py
+      python run_all.py --days 17 21 22 23 --jobs 4
+
+    The days which took longest according to the recorded timings (see
+    benchmark.py) are started first, so that the total wall time approaches
+    the time of the slowest day. Every run is recorded as well. The worker
+    processes are reused and the timings leave out interpreter start and
+    imports, benchmark.py --cold measures those.
+
+    Answers are cached (see common/cache.py): days whose source code and
+    input didn't change since the last run are not solved again.
+"""
+
+import argparse
+import concurrent.futures
+import contextlib
+import datetime
+import io
+import os
+import platform
+import sys
+import time
+
+import benchmark
+from common import cache, days
+
+PARTS = ["parse", "part1", "part2"]
+
+
+def init_worker():
+    # No plot windows from the worker processes (Day 23, Day 25).
+    os.environ.setdefault("MPLBACKEND", "Agg")
+    # Used by most days, imported once per worker
+    import numpy
+
+
+def solve_day(day):
+    # Executed in a worker process, which is reused for other days. The input
+    # is parsed once for both parts.
+    timings = dict()
+    answers = []
+    with contextlib.redirect_stdout(io.StringIO()):
+        module = days.load_day(day)
+        lines, timings["input"] = benchmark.timed(days.read_lines, day)
+        data, timings["parse"] = benchmark.timed(module.parse_input, lines)
+        for part in ("part1", "part2"):
+            func = getattr(module, part, None)
+            if func is not None:
+                answer, timings[part] = benchmark.timed(func, data)
+                answers.append(answer)
+    return timings, answers
+
+
+def from_cache(cached):
+    answers = [str(cached[part][0]) for part in ("part1", "part2") if part in cached]
+    return {"answers": answers, "timings": {part: seconds for part, (_, seconds) in cached.items()}, "cached": True}
+
+
+def to_cache(timings, answers):
+    results = {phase: (None, seconds) for phase, seconds in timings.items()}
+    for part, answer in zip(("part1", "part2"), answers):
+        results[part] = (answer, timings[part])
+    return results
+
+
+def recorded_durations(history):
+    # Latest recorded total time of every day, independent of the mode
+    # (warm/cold repetitions of benchmark.py or pool of this script).
+    durations = dict()
+    for entry in history:
+        for name, result in entry["results"].items():
+            for mode in ("pool", "cold", "warm"):
+                stats = result.get(mode, dict())
+                if len(stats) > 0:
+                    durations[name] = sum([s["median"] for s in stats.values()])
+                    break
+    return durations
+
+
+def schedule(day_list, durations):
+    # Longest first, days without recorded time before all others.
+    return sorted(day_list, key=lambda day: -durations.get(days.day_name(day), float("inf")))
+
+
+def print_table(results, wall_time):
+    print(f"{'Day':<6}{'Answer 1':>20}{'Answer 2':>20}" + "".join([f"{p:>10}" for p in ["input"] + PARTS]) + f"{'Total':>10}")
+    cpu_time = 0
+    for name, result in sorted(results.items()):
+        if "error" in result:
+            print(f"{name:<6}  ERROR {result['error']}")
+            continue
+        answers = result["answers"] + [""] * (2 - len(result["answers"]))
+        timings = result["timings"]
+        total = sum(timings.values())
+        if "cached" in result:
+            name += "*"
+        else:
+            cpu_time += total
+        print(
+            f"{name:<6}{answers[0]:>20}{answers[1]:>20}"
+            + "".join([f"{timings.get(p, 0):>10.3f}" for p in ["input"] + PARTS])
+            + f"{total:>10.3f}"
+        )
+    print(f"Sum of all solved days: {cpu_time:.3f} s, wall time: {wall_time:.3f} s")
+    if any(map(lambda r: "cached" in r, results.values())):
+        print("* cached answers, times of the run which computed them")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Solve all DayNN puzzles on a process pool.")
+    parser.add_argument("--days", type=int, nargs="+", default=days.DAYS)
+    parser.add_argument("--jobs", type=int, default=os.cpu_count(), help="number of worker processes")
+    parser.add_argument("--history", default=os.path.join(days.ROOT_DIR, "benchmark_history.json"))
+    parser.add_argument("--cache", default=cache.DEFAULT_PATH, help="SQLite file of the cached answers")
+    parser.add_argument("--no-cache", action="store_true", help="solve all days again")
+    args = parser.parse_args()
+
+    history = benchmark.load_json(args.history, [])
+    order = schedule(args.days, recorded_durations(history))
+
+    start_time = time.perf_counter()
+    results = dict()
+    with cache.ResultCache(args.cache) as result_cache:
+        keys = {day: cache.day_key(day) for day in order}
+        if not args.no_cache:
+            for day in order:
+                cached = result_cache.get(keys[day])
+                if len(cached) > 0:
+                    results[days.day_name(day)] = from_cache(cached)
+            order = [day for day in order if days.day_name(day) not in results]
+
+        with concurrent.futures.ProcessPoolExecutor(max_workers=args.jobs, initializer=init_worker) as executor:
+            futures = {executor.submit(solve_day, day): day for day in order}
+            for i, future in enumerate(concurrent.futures.as_completed(futures), 1):
+                day = futures[future]
+                name = days.day_name(day)
+                try:
+                    timings, answers = future.result()
+                except Exception as e:
+                    results[name] = {"error": repr(e)}
+                else:
+                    results[name] = {"answers": [str(a) for a in answers], "timings": timings}
+                    result_cache.put(keys[day], name, to_cache(timings, answers))
+                print(f"Finished {name} ({i}/{len(futures)})", file=sys.stderr)
+    wall_time = time.perf_counter() - start_time
+    print_table(results, wall_time)
+
+    history.append(
+        {
+            "timestamp": datetime.datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "jobs": args.jobs,
+            "results": {
+                name: {
+                    "answers": result["answers"],
+                    "pool": {phase: benchmark.summarize([t]) for phase, t in result["timings"].items()},
+                }
+                for name, result in results.items()
+                if "error" not in result and "cached" not in result
+            },
+        }
+    )
+    benchmark.save_json(args.history, history)
+    return 1 if any(map(lambda r: "error" in r, results.values())) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())